@@ -0,0 +1,7 @@
+"""Run the search benchmarks with python -m benchmarks."""
+
+import sys
+
+from benchmarks.search import main
+
+sys.exit(main())
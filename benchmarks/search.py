@@ -0,0 +1,391 @@
+"""Benchmark search latency, throughput and recall of the vector store.
+
+The benchmark builds a search index from a labelled CSV (label and text
+columns, like tests/data/example.csv) or from a synthetic corpus, loads it
+into the vector store manager and replays a query corpus through
+VectorStoreManager.search and, optionally, the HTTP search route using an
+in-process client. Results are written as JSON so that runs can be compared.
+
+Text is encoded with a deterministic hashing encoder by default, so the
+benchmark runs offline and measures the index rather than the model. Pass
+--encoder model to include the sentence-transformer in the measurements.
+
+Run with:
+    python -m benchmarks --synthetic 50000 --backend ivf --output results.json
+"""
+
+import argparse
+import asyncio
+import json
+import os
+import resource
+import sys
+import tempfile
+import time
+import zlib
+from collections.abc import Callable, Sequence
+from concurrent.futures import ThreadPoolExecutor
+from typing import Any
+
+import httpx
+import numpy as np
+import pandas as pd
+
+from sic_classification_vector_store.api.main import app
+from sic_classification_vector_store.utils.ann import FlatBackend, build_backend
+from sic_classification_vector_store.utils.cache import EmbeddingCache, ResultCache
+from sic_classification_vector_store.utils.encoder import SentenceEncoder
+from sic_classification_vector_store.utils.quantisation import (
+    Float32Storage,
+    quantise,
+)
+from sic_classification_vector_store.utils.search_index import SearchIndex
+from sic_classification_vector_store.utils.vector_store import (
+    SEARCH_RERANK_FACTOR,
+    SearchQuery,
+    vector_store_manager,
+)
+
+DEFAULT_MODEL_NAME = "all-MiniLM-L6-v2"
+PERCENTILES = (50, 95, 99)
+# Vocabulary of the synthetic index texts
+_WORDS = (  # noqa: SIM905
+    "farm crop cattle dairy forest timber fish mining coal quarry food "
+    "bakery brewery textile clothing leather wood paper printing chemical "
+    "plastic glass cement steel metal machinery electronic vehicle ship "
+    "aircraft furniture repair electricity gas water waste construction "
+    "road retail wholesale transport warehouse postal hotel restaurant "
+    "publishing software telecom bank insurance property legal accounting "
+    "consulting architect research advertising rental travel security "
+    "cleaning school hospital care sport"
+).split()
+
+
+class HashingEncoder:
+    """Deterministic bag-of-words encoder for offline benchmarks.
+
+    Each word maps to a fixed random vector seeded by its hash, and a text is
+    the normalised sum of its word vectors, so texts sharing words are close.
+    """
+
+    def __init__(self, dimension: int = 384):
+        """Initialise the encoder.
+
+        Args:
+            dimension: Dimension of the encoded vectors.
+        """
+        self.dimension = dimension
+        self._words: dict[str, np.ndarray] = {}
+
+    def encode(self, texts: list[str]) -> np.ndarray:
+        """Encode a list of texts into normalised float32 vectors."""
+        vectors = np.zeros((len(texts), self.dimension), dtype=np.float32)
+        for row, text in enumerate(texts):
+            for word in text.lower().split():
+                vectors[row] += self._word(word)
+        norms = np.linalg.norm(vectors, axis=1, keepdims=True)
+        return vectors / np.maximum(norms, 1e-9)
+
+    def _word(self, word: str) -> np.ndarray:
+        """Return the fixed random vector of a word."""
+        if word not in self._words:
+            rng = np.random.default_rng(zlib.crc32(word.encode("utf-8")))
+            self._words[word] = rng.standard_normal(self.dimension).astype(np.float32)
+        return self._words[word]
+
+
+def synthetic_corpus(size: int, seed: int = 0) -> tuple[list[str], list[str]]:
+    """Generate SIC-like labels and index texts.
+
+    Args:
+        size: Number of index entries.
+        seed: Seed for the random texts.
+
+    Returns:
+        tuple: The labels and texts of the corpus.
+    """
+    rng = np.random.default_rng(seed)
+    labels = [f"{code:05d}" for code in rng.integers(1110, 99000, size=size)]
+    texts = [" ".join(rng.choice(_WORDS, size=rng.integers(2, 7))) for _ in range(size)]
+    return labels, texts
+
+
+def read_corpus(path: str) -> tuple[list[str], list[str]]:
+    """Read the labels and texts of an index source CSV."""
+    source = pd.read_csv(path, dtype=str, keep_default_na=False)
+    return source["label"].tolist(), source["text"].tolist()
+
+
+def make_queries(texts: Sequence[str], count: int, seed: int = 0) -> list[SearchQuery]:
+    """Build a query corpus by sampling and perturbing index texts.
+
+    Each query searches an index text with a word dropped as the industry
+    description and another index text as the job title.
+
+    Args:
+        texts: The index texts.
+        count: Number of queries.
+        seed: Seed for the sampling.
+
+    Returns:
+        list: The (industry_descr, job_title, job_description) queries.
+    """
+    rng = np.random.default_rng(seed)
+    queries = []
+    for first, second in rng.integers(0, len(texts), size=(count, 2)):
+        words = texts[first].split()
+        if len(words) > 1:
+            words.pop(int(rng.integers(len(words))))
+        queries.append((" ".join(words), texts[second], ""))
+    return queries
+
+
+def read_queries(path: str) -> list[SearchQuery]:
+    """Read a query corpus CSV with industry_descr, job_title and job_description."""
+    source = pd.read_csv(path, dtype=str, keep_default_na=False)
+    return list(
+        source[["industry_descr", "job_title", "job_description"]].itertuples(
+            index=False, name=None
+        )
+    )
+
+
+def percentiles(samples: Sequence[float]) -> dict[str, float]:
+    """Summarise latency samples in seconds as millisecond percentiles."""
+    values = np.percentile(np.asarray(samples) * 1000, PERCENTILES)
+    summary = {f"p{p}_ms": float(v) for p, v in zip(PERCENTILES, values, strict=True)}
+    summary["mean_ms"] = float(np.mean(samples) * 1000)
+    return summary
+
+
+def memory_usage() -> dict[str, int]:
+    """Report the current and peak resident set size of the process in bytes."""
+    peak = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    # ru_maxrss is in kilobytes on Linux and bytes on macOS
+    usage = {"peak_rss_bytes": peak if sys.platform == "darwin" else peak * 1024}
+    try:
+        with open("/proc/self/statm", encoding="utf-8") as f:
+            usage["rss_bytes"] = int(f.read().split()[1]) * os.sysconf("SC_PAGE_SIZE")
+    except OSError:
+        pass
+    return usage
+
+
+def measure_latency(queries: Sequence[SearchQuery]) -> dict[str, float]:
+    """Time each query searched one at a time."""
+    samples = []
+    for query in queries:
+        start = time.perf_counter()
+        vector_store_manager.search(*query)
+        samples.append(time.perf_counter() - start)
+    return percentiles(samples)
+
+
+def measure_throughput(
+    queries: Sequence[SearchQuery], concurrency: int
+) -> dict[str, float]:
+    """Measure queries per second with concurrent callers on threads."""
+
+    def search(query: SearchQuery) -> float:
+        start = time.perf_counter()
+        vector_store_manager.search(*query)
+        return time.perf_counter() - start
+
+    start = time.perf_counter()
+    with ThreadPoolExecutor(max_workers=concurrency) as pool:
+        samples = list(pool.map(search, queries))
+    elapsed = time.perf_counter() - start
+    return {"concurrency": concurrency, "qps": len(queries) / elapsed} | percentiles(
+        samples
+    )
+
+
+async def measure_http(
+    queries: Sequence[SearchQuery], concurrency: int
+) -> dict[str, Any]:
+    """Measure the search route with concurrent requests from an in-process client."""
+    semaphore = asyncio.Semaphore(concurrency)
+    samples: list[float] = []
+    errors = 0
+
+    async def search(client: httpx.AsyncClient, query: SearchQuery) -> None:
+        nonlocal errors
+        async with semaphore:
+            start = time.perf_counter()
+            response = await client.post(
+                "/v1/sic-vector-store/search-index",
+                json=dict(
+                    zip(
+                        ("industry_descr", "job_title", "job_description"),
+                        query,
+                        strict=True,
+                    )
+                ),
+            )
+            samples.append(time.perf_counter() - start)
+            errors += response.status_code != 200  # noqa: PLR2004
+
+    transport = httpx.ASGITransport(app=app)
+    async with httpx.AsyncClient(
+        transport=transport, base_url="http://benchmark"
+    ) as client:
+        start = time.perf_counter()
+        await asyncio.gather(*(search(client, query) for query in queries))
+        elapsed = time.perf_counter() - start
+    return {
+        "concurrency": concurrency,
+        "qps": len(queries) / elapsed,
+        "errors": errors,
+    } | percentiles(samples)
+
+
+def measure_recall(
+    index: SearchIndex,
+    full_vectors: np.ndarray,
+    encode: Callable[[list[str]], np.ndarray],
+    queries: Sequence[SearchQuery],
+    k: int,
+) -> float:
+    """Compute recall@k of the index against an exact float32 search.
+
+    Args:
+        index: The search index being benchmarked.
+        full_vectors: Full precision index vectors used for the exact search.
+        encode: Function encoding texts into normalised vectors.
+        queries: The query corpus.
+        k: Number of matches compared per query string.
+
+    Returns:
+        float: Fraction of the exact top k matches found by the index.
+    """
+    texts = list(dict.fromkeys(text for query in queries for text in query))
+    vectors = encode(texts)
+    k = min(k, len(index))
+    _, ids = index.search(vectors, k, rerank_factor=SEARCH_RERANK_FACTOR)
+    _, exact_ids = FlatBackend().search(Float32Storage(full_vectors), vectors, k)
+    found = sum(
+        len(set(row) & set(exact_row))
+        for row, exact_row in zip(ids.tolist(), exact_ids.tolist(), strict=True)
+    )
+    return found / exact_ids.size
+
+
+def run(args: argparse.Namespace) -> dict[str, Any]:
+    """Build, load and benchmark a search index.
+
+    Args:
+        args: The parsed command line arguments.
+
+    Returns:
+        dict: The benchmark results.
+    """
+    if args.source:
+        labels, texts = read_corpus(args.source)
+    else:
+        labels, texts = synthetic_corpus(args.synthetic, seed=args.seed)
+    encoder = (
+        SentenceEncoder(args.model)
+        if args.encoder == "model"
+        else HashingEncoder(args.dimension)
+    )
+    queries = (
+        read_queries(args.queries)
+        if args.queries
+        else make_queries(texts, args.num_queries, seed=args.seed)
+    )
+
+    with tempfile.TemporaryDirectory() as db_dir:
+        start = time.perf_counter()
+        vectors = encoder.encode(texts)
+        SearchIndex(
+            quantise(vectors, args.storage),
+            labels,
+            texts,
+            embedding_model_name=args.model,
+            k_matches=args.k,
+            full_vectors=vectors,
+            backend=build_backend(vectors, args.backend),
+        ).save(db_dir)
+        build_seconds = time.perf_counter() - start
+
+        start = time.perf_counter()
+        index = SearchIndex.load(db_dir)
+        load_seconds = time.perf_counter() - start
+
+        vector_store_manager.index = index
+        vector_store_manager.encoder = encoder  # type: ignore[assignment]
+        vector_store_manager.embed = None
+        if not args.cache:
+            vector_store_manager.cache = ResultCache(0)
+            vector_store_manager.embedding_cache = EmbeddingCache(0)
+        vector_store_manager.ready_event.set()
+
+        results: dict[str, Any] = {
+            "config": {
+                "index_size": len(index),
+                "dimension": index.storage.dimension,
+                "queries": len(queries),
+                "k": args.k,
+                "encoder": args.encoder,
+                "cache": args.cache,
+                "rerank_factor": SEARCH_RERANK_FACTOR,
+                **index.footprint(),
+            },
+            "build_seconds": build_seconds,
+            "load_seconds": load_seconds,
+            "recall_at_k": measure_recall(
+                index, vectors, encoder.encode, queries, args.k
+            ),
+            "latency": measure_latency(queries),
+            "throughput": [measure_throughput(queries, c) for c in args.concurrency],
+        }
+        if args.http:
+            results["http"] = [
+                asyncio.run(measure_http(queries, c)) for c in args.concurrency
+            ]
+        vector_store_manager.executor.shutdown()
+    results["memory"] = memory_usage()
+    return results
+
+
+def main(argv: list[str] | None = None) -> int:
+    """Parse the command line, run the benchmark and write its results.
+
+    Args:
+        argv: Command line arguments. Defaults to sys.argv.
+
+    Returns:
+        int: The process exit code.
+    """
+    parser = argparse.ArgumentParser(
+        description="Benchmark search latency, throughput and recall."
+    )
+    corpus = parser.add_mutually_exclusive_group()
+    corpus.add_argument("--source", help="Index source CSV with label and text")
+    corpus.add_argument(
+        "--synthetic", type=int, default=10000, help="Size of a synthetic index"
+    )
+    parser.add_argument("--queries", help="Query CSV, sampled from the index if unset")
+    parser.add_argument("--num-queries", type=int, default=1000)
+    parser.add_argument("--k", type=int, default=5)
+    parser.add_argument("--storage", default="float32")
+    parser.add_argument("--backend", default="flat")
+    parser.add_argument("--encoder", choices=("hash", "model"), default="hash")
+    parser.add_argument("--model", default=DEFAULT_MODEL_NAME)
+    parser.add_argument("--dimension", type=int, default=384)
+    parser.add_argument(
+        "--concurrency", type=int, nargs="+", default=[1, 4, 16], metavar="N"
+    )
+    parser.add_argument("--http", action="store_true", help="Also benchmark the route")
+    parser.add_argument("--cache", action="store_true", help="Keep the caches enabled")
+    parser.add_argument("--seed", type=int, default=0)
+    parser.add_argument("--output", help="Write the JSON results to this file")
+    args = parser.parse_args(argv)
+
+    results = json.dumps(run(args), indent=2)
+    if args.output:
+        with open(args.output, "w", encoding="utf-8") as f:
+            f.write(results)
+    else:
+        print(results)
+    return 0
@@ -4,43 +4,74 @@ This module contains the main entry point to the API.
 It defines the FastAPI application and the API endpoints.
 """
 
+import time
 from contextlib import asynccontextmanager
-from threading import Thread
+from threading import Event, Thread
 
-from fastapi import FastAPI, Request
+from fastapi import FastAPI, Request, Response
 from fastapi.responses import JSONResponse
+from starlette.middleware.base import RequestResponseEndpoint
 from survey_assist_utils.logging import get_logger
 
+from sic_classification_vector_store.api.routes.metrics import router as metrics_router
+from sic_classification_vector_store.api.routes.v1.reload import router as reload_router
 from sic_classification_vector_store.api.routes.v1.search_index import (
     router as search_index_router,
 )
 from sic_classification_vector_store.api.routes.v1.status import router as status_router
-from sic_classification_vector_store.utils.vector_store import vector_store_manager
+from sic_classification_vector_store.utils.metrics import (
+    METRICS_ENABLED,
+    REQUEST_SECONDS,
+    REQUESTS_IN_FLIGHT,
+    SERVER_TIMING_ENABLED,
+    record_stage,
+    server_timing,
+    stage_timings,
+)
+from sic_classification_vector_store.utils.vector_store import (
+    INDEX_WATCH_INTERVAL_SECONDS,
+    vector_store_manager,
+)
 
 logger = get_logger(__name__)
 
 
+def background_load():
+    """Load the vector store and mark it ready, recording any load error."""
+    try:
+        logger.info("Loading the vector store")
+        vector_store_manager.load()
+        vector_store_manager.ready_event.set()
+        logger.info("Vector store is ready")
+    except Exception as e:  # pylint: disable=broad-exception-caught
+        vector_store_manager.load_error = str(e)
+        logger.error(f"Error loading vector store: {e}", exc_info=True)
+        vector_store_manager.ready_event.set()  # Set event even on error to prevent hanging
+
+
 @asynccontextmanager
 async def lifespan(_app: FastAPI):
     """FastAPI lifespan handler to load vector store in background."""
-
-    def background_load():
-        try:
-            logger.info("Loading the vector store")
-            vector_store_manager.load()
-            vector_store_manager.ready_event.set()
-            logger.info("Vector store is ready")
-        except Exception as e:  # pylint: disable=broad-exception-caught
-            vector_store_manager.load_error = str(e)
-            logger.error(f"Error loading vector store: {e}", exc_info=True)
-            vector_store_manager.ready_event.set()  # Set event even on error to prevent hanging
-
-    # Start loading in a separate thread
-    Thread(target=background_load, daemon=True).start()
+    if vector_store_manager.loaded:
+        # Preloaded by the pre-fork server before this worker was forked
+        logger.info("Vector store already loaded")
+    else:
+        # Start loading in a separate thread
+        Thread(target=background_load, daemon=True).start()
+
+    stop_watching = Event()
+    if INDEX_WATCH_INTERVAL_SECONDS > 0:
+        Thread(
+            target=vector_store_manager.watch,
+            args=(INDEX_WATCH_INTERVAL_SECONDS, stop_watching),
+            daemon=True,
+        ).start()
 
     yield  # Let the app run
 
     logger.info("Shutting down...")
+    stop_watching.set()
+    vector_store_manager.executor.shutdown()
 
 
 app: FastAPI = FastAPI(
@@ -61,9 +92,54 @@ async def generic_error_handler(_request: Request, exc: Exception) -> JSONRespon
     )
 
 
+@app.middleware("http")
+async def record_request_metrics(
+    request: Request, call_next: RequestResponseEndpoint
+) -> Response:
+    """Time each request and its stages.
+
+    Routes that mark when their handler starts and finishes also get parse
+    and serialise stages, measured either side of the handler.
+    """
+    if not METRICS_ENABLED:
+        return await call_next(request)
+    start = time.perf_counter()
+    timings: dict[str, float] = {}
+    token = stage_timings.set(timings)
+    REQUESTS_IN_FLIGHT.inc()
+    status = 500
+    try:
+        response = await call_next(request)
+        status = response.status_code
+    finally:
+        REQUESTS_IN_FLIGHT.dec()
+        stage_timings.reset(token)
+        end = time.perf_counter()
+        # None of the routes take path parameters, so the path names the route
+        route = request.url.path if "route" in request.scope else "unmatched"
+        REQUEST_SECONDS.observe(end - start, route, str(status))
+    handler_started = getattr(request.state, "handler_started", None)
+    handler_finished = getattr(request.state, "handler_finished", None)
+    if handler_started is not None and handler_finished is not None:
+        timings = {
+            "parse": handler_started - start,
+            **timings,
+            "serialise": end - handler_finished,
+        }
+        for stage in ("parse", "serialise"):
+            record_stage(stage, timings[stage])
+    if SERVER_TIMING_ENABLED:
+        response.headers["Server-Timing"] = server_timing(
+            {**timings, "total": end - start}
+        )
+    return response
+
+
 # Include versioned routes
 app.include_router(status_router, prefix="/v1/sic-vector-store")
 app.include_router(search_index_router, prefix="/v1/sic-vector-store")
+app.include_router(reload_router, prefix="/v1/sic-vector-store")
+app.include_router(metrics_router)
 
 
 @app.get("/")
@@ -0,0 +1,44 @@
+"""This module contains the models for the status response.
+
+The models in this module extend the embedding status returned by the
+embedding handler with the vector store's own runtime state.
+"""
+
+from industrial_classification_utils.models.config_model import EmbeddingStatus
+from pydantic import BaseModel
+
+
+class CacheStatus(BaseModel):
+    """Model representing the size and hit/miss counters of a cache."""
+
+    enabled: bool = False
+    size: int = 0
+    max_size: int = 0
+    hits: int = 0
+    misses: int = 0
+
+
+class IndexStatus(BaseModel):
+    """Model representing the storage precision and footprint of the search index."""
+
+    backend: str
+    storage: str
+    rerank: bool
+    rerank_factor: int
+    vectors_bytes: int
+    full_precision_bytes: int
+    backend_bytes: int
+    metadata_bytes: int
+
+
+class VectorStoreStatus(EmbeddingStatus):
+    """Model representing the status of the vector store."""
+
+    search_index: IndexStatus | None = None
+    version: str | None = None
+    loaded_at: str | None = None
+    reloading: bool = False
+    reload_error: str | None = None
+
+    result_cache: CacheStatus = CacheStatus()
+    embedding_cache: CacheStatus = CacheStatus()
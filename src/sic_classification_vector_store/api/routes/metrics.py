@@ -0,0 +1,41 @@
+"""Module that provides the metrics endpoint for the SIC Vector Store API.
+
+The endpoint is served outside the versioned API at /metrics, where
+Prometheus scrapers expect it, and reports the metrics of the process that
+serves the request.
+"""
+
+from fastapi import APIRouter
+from fastapi.responses import PlainTextResponse
+
+from sic_classification_vector_store.utils.metrics import (
+    CACHE_ENTRIES,
+    CACHE_HITS,
+    CACHE_MISSES,
+    CONTENT_TYPE,
+    INDEX_ENTRIES,
+    registry,
+)
+from sic_classification_vector_store.utils.vector_store import vector_store_manager
+
+router = APIRouter(tags=["Metrics"])
+
+
+@router.get("/metrics", response_class=PlainTextResponse)
+async def get_metrics() -> PlainTextResponse:
+    """Get the metrics in the Prometheus text exposition format.
+
+    Returns:
+        PlainTextResponse: The rendered metrics.
+    """
+    index = vector_store_manager.index
+    INDEX_ENTRIES.set(value=len(index) if index is not None else 0)
+    for name, cache in (
+        ("result", vector_store_manager.cache),
+        ("embedding", vector_store_manager.embedding_cache),
+    ):
+        stats = cache.stats()
+        CACHE_ENTRIES.set(name, value=stats["size"])
+        CACHE_HITS.set(name, value=stats["hits"])
+        CACHE_MISSES.set(name, value=stats["misses"])
+    return PlainTextResponse(registry.render(), media_type=CONTENT_TYPE)
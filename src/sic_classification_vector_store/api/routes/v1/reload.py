@@ -0,0 +1,55 @@
+"""Module that provides the reload endpoint for the SIC Vector Store API.
+
+This module contains the admin endpoint that reloads the vector store in the
+background while the current index keeps serving searches.
+"""
+
+import os
+import secrets
+from http import HTTPStatus
+from typing import Annotated
+
+from fastapi import APIRouter, Header, HTTPException
+from survey_assist_utils.logging import get_logger
+
+from sic_classification_vector_store.utils.vector_store import vector_store_manager
+
+logger = get_logger(__name__)
+
+router = APIRouter(tags=["Admin"])
+
+# Configuration from environment variables with defaults
+ADMIN_TOKEN = os.getenv("ADMIN_TOKEN", "")
+
+
+@router.post("/reload", status_code=HTTPStatus.ACCEPTED)
+async def post_reload(
+    x_admin_token: Annotated[str | None, Header()] = None,
+) -> dict[str, str]:
+    """Start reloading the vector store in the background.
+
+    Args:
+        x_admin_token: Admin token from the X-Admin-Token header.
+
+    Returns:
+        dict: The reload status and the version currently being served.
+
+    Raises:
+        HTTPException: If reloading is disabled, the token is wrong or a
+            reload is already in progress
+    """
+    if not ADMIN_TOKEN:
+        raise HTTPException(
+            status_code=HTTPStatus.FORBIDDEN,
+            detail="Reload endpoint is disabled, set ADMIN_TOKEN to enable it",
+        )
+    if x_admin_token is None or not secrets.compare_digest(x_admin_token, ADMIN_TOKEN):
+        raise HTTPException(
+            status_code=HTTPStatus.UNAUTHORIZED, detail="Invalid admin token"
+        )
+    if not vector_store_manager.start_reload():
+        raise HTTPException(
+            status_code=HTTPStatus.CONFLICT, detail="A reload is already in progress"
+        )
+    logger.info("Vector store reload started")
+    return {"status": "reloading", "version": vector_store_manager.version or ""}
@@ -4,6 +4,9 @@ This module contains the search endpoint for the SIC Vector Store API.
 It defines the search endpoint and returns search results from the vector store.
 """
 
+import os
+import time
+
 from fastapi import APIRouter, HTTPException, Request
 from industrial_classification_utils.embed import SearchIndexResponse
 from survey_assist_utils.logging import get_logger
@@ -11,37 +14,106 @@ from survey_assist_utils.logging import get_logger
 from sic_classification_vector_store.api.models.search_index import (
     SearchIndexRequest,
 )
+from sic_classification_vector_store.utils.common import safe_int
+from sic_classification_vector_store.utils.search_executor import SearchQueueFullError
 from sic_classification_vector_store.utils.vector_store import vector_store_manager
 
 logger = get_logger(__name__)
 
 router: APIRouter = APIRouter()
 
+# Configuration from environment variables with defaults
+SEARCH_BATCH_MAX_SIZE = safe_int(os.getenv("SEARCH_BATCH_MAX_SIZE"), default=1000)
+
 
 @router.post("/search-index", response_model=SearchIndexResponse)
 async def post_search_index(
-    _request: Request, payload: SearchIndexRequest
+    request: Request, payload: SearchIndexRequest
 ) -> SearchIndexResponse:
     """Get the indexes from the vector store.
 
     Args:
-        _request: FastAPI request object (unused)
+        request: FastAPI request object, used to record the handler timings
         payload: Search request payload
 
     Returns:
         SearchIndexResponse: Search results from the vector store
 
     Raises:
-        HTTPException: If the vector store is not ready or there is an error searching
+        HTTPException: If the vector store is not ready, the search queue is full
+            or there is an error searching
     """
+    request.state.handler_started = time.perf_counter()
     try:
-        search_results = vector_store_manager.search(
+        search_results = await vector_store_manager.search_async(
             industry_descr=payload.industry_descr,
             job_title=payload.job_title,
             job_description=payload.job_description,
         )
         logger.info("Search completed successfully")
+        request.state.handler_finished = time.perf_counter()
+        return search_results
+    except SearchQueueFullError as e:
+        logger.warning(f"Search rejected: {e}")
+        raise HTTPException(
+            status_code=429,
+            detail=str(e),
+            headers={"Retry-After": "1"},
+        ) from e
+    except RuntimeError as e:
+        logger.error(f"Vector store error: {e}", exc_info=True)
+        raise HTTPException(
+            status_code=503,
+            detail=str(e),
+        ) from e
+    except Exception as e:
+        logger.error(f"Error searching vector store: {e}", exc_info=True)
+        raise HTTPException(
+            status_code=500,
+            detail=f"Error searching vector store: {e!s}",
+        ) from e
+
+
+@router.post("/search-index/batch", response_model=list[SearchIndexResponse])
+async def post_search_index_batch(
+    request: Request, payload: list[SearchIndexRequest]
+) -> list[SearchIndexResponse]:
+    """Get the indexes from the vector store for a batch of queries.
+
+    Args:
+        request: FastAPI request object, used to record the handler timings
+        payload: List of search request payloads
+
+    Returns:
+        list[SearchIndexResponse]: Search results for each payload, in order
+
+    Raises:
+        HTTPException: If the batch is too large, the vector store is not ready,
+            the search queue is full or there is an error searching
+    """
+    request.state.handler_started = time.perf_counter()
+    if len(payload) > SEARCH_BATCH_MAX_SIZE:
+        raise HTTPException(
+            status_code=413,
+            detail=f"Batch size {len(payload)} exceeds the maximum of {SEARCH_BATCH_MAX_SIZE}",
+        )
+    try:
+        search_results = await vector_store_manager.search_batch_async(
+            [
+                (item.industry_descr, item.job_title, item.job_description)
+                for item in payload
+            ]
+        )
+        logger.info(f"Batch search completed successfully - size: {len(payload)}")
+        request.state.handler_finished = time.perf_counter()
         return search_results
+    except SearchQueueFullError as e:
+        logger.warning(f"Search rejected: {e}")
+        raise HTTPException(
+            status_code=429,
+            detail=str(e),
+            headers={"Retry-After": "1"},
+        ) from e
     except RuntimeError as e:
         logger.error(f"Vector store error: {e}", exc_info=True)
         raise HTTPException(
@@ -7,8 +7,11 @@ It defines the configuration endpoint and returns the current configuration sett
 from typing import Annotated
 
 from fastapi import APIRouter, Depends
-from industrial_classification_utils.models.config_model import EmbeddingStatus
 
+from sic_classification_vector_store.api.models.status import (
+    CacheStatus,
+    VectorStoreStatus,
+)
 from sic_classification_vector_store.utils.vector_store import (
     VectorStoreManager,
     vector_store_manager,
@@ -26,27 +29,36 @@ def get_vector_store():
     return vector_store_manager
 
 
-@router.get("/status", response_model=EmbeddingStatus)
+@router.get("/status", response_model=VectorStoreStatus)
 async def get_status(
     vector_store: Annotated[VectorStoreManager, Depends(get_vector_store)],
-) -> EmbeddingStatus:
+) -> VectorStoreStatus:
     """Get the current status of the vector store.
 
     Args:
         vector_store: Vector store manager instance
 
     Returns:
-        EmbeddingStatus: A dictionary containing the current status.
+        VectorStoreStatus: A dictionary containing the current status.
     """
     status_str = _resolve_status(vector_store)
-    if status_str == "ready" and vector_store.embed is not None:
-        return vector_store.embed.get_embed_config()
-    return EmbeddingStatus(
+    runtime = {
+        "result_cache": CacheStatus(**vector_store.cache.stats()),
+        "embedding_cache": CacheStatus(**vector_store.embedding_cache.stats()),
+        "version": vector_store.version,
+        "loaded_at": vector_store.loaded_at,
+        "reloading": vector_store.reloading,
+        "reload_error": vector_store.reload_error,
+    }
+    if status_str == "ready":
+        return VectorStoreStatus(**vector_store.get_embed_config(), **runtime)
+    return VectorStoreStatus(
         status=status_str,
         embedding_model_name="",
         db_dir="",
         k_matches=1,
         index_size=0,
+        **runtime,
     )
 
 
@@ -55,7 +67,7 @@ def _resolve_status(vector_store: VectorStoreManager) -> str:
     if vector_store.load_error is not None:
         return "error"
 
-    if vector_store.ready_event.is_set() and vector_store.embed is not None:
+    if vector_store.ready_event.is_set() and vector_store.loaded:
         return "ready"
 
     return "loading"
@@ -0,0 +1,147 @@
+"""Pre-fork multi-worker server for the SIC Vector Store API.
+
+The vector store is loaded once in the parent process, then the parent forks
+the uvicorn workers, which all accept connections from one shared listening
+socket. The memory-mapped search index is shared through the page cache and
+the model weights are shared copy-on-write, so N workers do not cost N copies
+of the index and model.
+
+Run with:
+    python -m sic_classification_vector_store.api.serve --workers 4
+"""
+
+import argparse
+import os
+import signal
+import socket
+import sys
+from contextlib import suppress
+
+import uvicorn
+from survey_assist_utils.logging import get_logger
+
+from sic_classification_vector_store.api.main import app, background_load
+from sic_classification_vector_store.utils.common import safe_int
+from sic_classification_vector_store.utils.encoder import set_inference_threads
+from sic_classification_vector_store.utils.vector_store import vector_store_manager
+
+logger = get_logger(__name__)
+
+# Configuration from environment variables with defaults
+HOST = os.getenv("HOST", "0.0.0.0")  # noqa: S104 # nosec B104
+PORT = safe_int(os.getenv("PORT"), default=8088)
+WEB_CONCURRENCY = safe_int(os.getenv("WEB_CONCURRENCY"), default=os.cpu_count() or 1)
+
+
+def threads_per_worker(workers: int, cpus: int | None = None) -> int:
+    """Share the available CPUs between the workers' inference threads.
+
+    Args:
+        workers: Number of worker processes.
+        cpus: Number of available CPUs. Defaults to the host's CPU count.
+
+    Returns:
+        int: Number of inference threads for each worker, at least 1.
+    """
+    cpus = cpus or os.cpu_count() or 1
+    return max(cpus // max(workers, 1), 1)
+
+
+def _bind_socket(host: str, port: int) -> socket.socket:
+    """Bind the listening socket shared by every worker."""
+    sock = socket.socket(socket.AF_INET, socket.SOCK_STREAM)
+    sock.setsockopt(socket.SOL_SOCKET, socket.SO_REUSEADDR, 1)
+    sock.bind((host, port))
+    sock.set_inheritable(True)
+    return sock
+
+
+def _run_worker(sock: socket.socket, threads: int) -> None:
+    """Serve the API from a forked worker process, then exit."""
+    set_inference_threads(threads)
+    server = uvicorn.Server(uvicorn.Config(app, log_level="info"))
+    server.run(sockets=[sock])
+    os._exit(0)
+
+
+def _fork_worker(sock: socket.socket, threads: int) -> int:
+    """Fork a worker and return its process id."""
+    pid = os.fork()
+    if pid == 0:
+        _run_worker(sock, threads)
+    logger.info(f"Started worker - pid: {pid}")
+    return pid
+
+
+def serve(host: str = HOST, port: int = PORT, workers: int = WEB_CONCURRENCY) -> int:
+    """Load the vector store and serve it from pre-forked worker processes.
+
+    Workers that exit unexpectedly are replaced until the server receives
+    SIGINT or SIGTERM, which is forwarded to every worker.
+
+    Args:
+        host: Address to listen on.
+        port: Port to listen on.
+        workers: Number of worker processes.
+
+    Returns:
+        int: The process exit code.
+    """
+    background_load()
+    if vector_store_manager.load_error is not None:
+        logger.error("Vector store failed to load, not starting workers")
+        return 1
+
+    sock = _bind_socket(host, port)
+    threads = threads_per_worker(workers)
+    logger.info(
+        f"Serving on {host}:{port} - workers: {workers}, threads per worker: {threads}"
+    )
+    pids = {_fork_worker(sock, threads) for _ in range(max(workers, 1))}
+    stopping = False
+
+    def stop(signum, _frame):
+        nonlocal stopping
+        stopping = True
+        for pid in list(pids):
+            with suppress(ProcessLookupError):
+                os.kill(pid, signum)
+
+    signal.signal(signal.SIGINT, stop)
+    signal.signal(signal.SIGTERM, stop)
+
+    while pids:
+        try:
+            pid, status = os.wait()
+        except ChildProcessError:
+            break
+        pids.discard(pid)
+        if not stopping:
+            logger.warning(f"Worker {pid} exited with status {status}, restarting")
+            pids.add(_fork_worker(sock, threads))
+    sock.close()
+    logger.info("All workers stopped")
+    return 0
+
+
+def main(argv: list[str] | None = None) -> int:
+    """Parse the command line and run the pre-fork server.
+
+    Args:
+        argv: Command line arguments. Defaults to sys.argv.
+
+    Returns:
+        int: The process exit code.
+    """
+    parser = argparse.ArgumentParser(
+        description="Pre-fork multi-worker server for the SIC Vector Store API."
+    )
+    parser.add_argument("--host", default=HOST)
+    parser.add_argument("--port", type=int, default=PORT)
+    parser.add_argument("--workers", type=int, default=WEB_CONCURRENCY)
+    args = parser.parse_args(argv)
+    return serve(host=args.host, port=args.port, workers=args.workers)
+
+
+if __name__ == "__main__":
+    sys.exit(main())
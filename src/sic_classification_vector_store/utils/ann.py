@@ -0,0 +1,330 @@
+"""Provides the nearest-neighbour search backends used by the search index.
+
+A backend finds the candidate rows for each query vector:
+
+    flat: exact brute-force scan of every stored vector
+    ivf: inverted file, scanning only the lists nearest to the query
+    hnsw: hierarchical navigable small world graph, requires hnswlib
+
+The flat and ivf backends score rows with the index's vector storage, so they
+work with every storage precision and their structures are sections of the
+search index artefact. The hnsw graph is written by hnswlib to its own file
+alongside the artefact.
+"""
+
+import os
+from typing import Any, ClassVar
+
+import numpy as np
+
+from sic_classification_vector_store.utils.common import safe_int
+from sic_classification_vector_store.utils.quantisation import (
+    VectorStorage,
+    kmeans,
+)
+
+try:
+    import hnswlib
+except ImportError:  # pragma: no cover - optional dependency
+    hnswlib = None
+
+# Runtime tuning from environment variables with defaults
+SEARCH_IVF_NPROBE = safe_int(os.getenv("SEARCH_IVF_NPROBE"), default=8)
+SEARCH_HNSW_EF = safe_int(os.getenv("SEARCH_HNSW_EF"), default=64)
+
+HNSW_INDEX_FILE = "search_index.hnsw"
+# Rows sampled per list when training the ivf centroids
+IVF_TRAINING_ROWS_PER_LIST = 64
+
+
+class SearchBackend:
+    """Base class for the nearest-neighbour search backends."""
+
+    name: ClassVar[str] = ""
+
+    def search(
+        self, storage: VectorStorage, queries: np.ndarray, k: int
+    ) -> tuple[np.ndarray, np.ndarray]:
+        """Find the best scoring rows for each query vector.
+
+        Args:
+            storage: The stored index vectors.
+            queries: float32 array of shape (n, dimension) of query vectors.
+            k: Number of candidates to return per query.
+
+        Returns:
+            tuple: Arrays of shape (n, k) holding the dot product scores and
+                the row ids of the candidates, each row best first. Rows with
+                fewer than k candidates are padded with id -1 and score -inf.
+        """
+        raise NotImplementedError
+
+    def params(self) -> dict[str, Any]:
+        """Return the parameters recorded in the artefact header."""
+        return {}
+
+    def sections(self) -> dict[str, np.ndarray]:
+        """Return the arrays written to the artefact, by section name."""
+        return {}
+
+    def save_files(self, db_dir: str) -> None:
+        """Write any structures kept outside the artefact into a directory."""
+
+    @property
+    def nbytes(self) -> int:
+        """Number of bytes used by the backend's structures."""
+        return int(sum(array.nbytes for array in self.sections().values()))
+
+    @classmethod
+    def from_artefact(
+        cls, sections: dict[str, np.ndarray], params: dict[str, Any], db_dir: str
+    ) -> "SearchBackend":
+        """Rebuild the backend from the artefact it was saved with."""
+        raise NotImplementedError
+
+
+class FlatBackend(SearchBackend):
+    """Exact search scoring every stored vector."""
+
+    name = "flat"
+
+    def search(
+        self, storage: VectorStorage, queries: np.ndarray, k: int
+    ) -> tuple[np.ndarray, np.ndarray]:
+        """Find the best scoring rows for each query vector."""
+        scores = storage.scores(queries)
+        ids = top_k(scores, k)
+        return np.take_along_axis(scores, ids, axis=1), ids
+
+    @classmethod
+    def from_artefact(
+        cls, sections: dict[str, np.ndarray], params: dict[str, Any], db_dir: str
+    ) -> "FlatBackend":
+        """Rebuild the backend from the artefact it was saved with."""
+        return cls()
+
+
+class IVFBackend(SearchBackend):
+    """Inverted file index over k-means clusters of the vectors.
+
+    Rows are grouped into lists by their nearest centroid and each query only
+    scores the rows of its nprobe nearest lists.
+    """
+
+    name = "ivf"
+
+    def __init__(
+        self,
+        centroids: np.ndarray,
+        offsets: np.ndarray,
+        ids: np.ndarray,
+        nprobe: int = SEARCH_IVF_NPROBE,
+    ):
+        """Initialise the backend.
+
+        Args:
+            centroids: float32 array of shape (lists, dimension).
+            offsets: int64 array of lists + 1 offsets into ids.
+            ids: int64 array of row ids ordered by list.
+            nprobe: Number of lists scanned per query.
+        """
+        self.centroids = centroids
+        self.offsets = offsets
+        self.ids = ids
+        self.nprobe = max(nprobe, 1)
+
+    @classmethod
+    def build(cls, vectors: np.ndarray, lists: int = 0, seed: int = 0) -> "IVFBackend":
+        """Cluster the vectors into inverted lists.
+
+        Args:
+            vectors: Array of shape (size, dimension) of normalised vectors.
+            lists: Number of lists. Defaults to the square root of the size.
+            seed: Seed for sampling the training rows and initial centroids.
+
+        Returns:
+            IVFBackend: The backend over the vectors.
+        """
+        size = vectors.shape[0]
+        lists = min(lists or max(int(np.sqrt(size)), 1), size)
+        rng = np.random.default_rng(seed)
+        training_rows = min(size, lists * IVF_TRAINING_ROWS_PER_LIST)
+        sample = vectors[rng.choice(size, size=training_rows, replace=False)]
+        centroids = kmeans(sample.astype(np.float32), lists, seed=seed)
+        assignment = np.argmax(vectors @ centroids.T, axis=1)
+        ids = np.argsort(assignment, kind="stable").astype(np.int64)
+        offsets = np.zeros(lists + 1, dtype=np.int64)
+        np.cumsum(np.bincount(assignment, minlength=lists), out=offsets[1:])
+        return cls(centroids, offsets, ids)
+
+    def search(
+        self, storage: VectorStorage, queries: np.ndarray, k: int
+    ) -> tuple[np.ndarray, np.ndarray]:
+        """Find the best scoring rows for each query vector."""
+        nprobe = min(self.nprobe, len(self.centroids))
+        probes = top_k(queries @ self.centroids.T, nprobe)
+        scores = np.full((queries.shape[0], k), -np.inf, dtype=np.float32)
+        ids = np.full((queries.shape[0], k), -1, dtype=np.int64)
+        for i, lists in enumerate(probes):
+            rows = np.concatenate(
+                [self.ids[self.offsets[j] : self.offsets[j + 1]] for j in lists]
+            )
+            if not len(rows):
+                continue
+            row_scores = storage.scores(queries[i : i + 1], rows)
+            best = top_k(row_scores, min(k, len(rows)))[0]
+            scores[i, : len(best)] = row_scores[0, best]
+            ids[i, : len(best)] = rows[best]
+        return scores, ids
+
+    def params(self) -> dict[str, Any]:
+        """Return the parameters recorded in the artefact header."""
+        return {"lists": len(self.centroids)}
+
+    def sections(self) -> dict[str, np.ndarray]:
+        """Return the arrays written to the artefact, by section name."""
+        return {
+            "ivf_centroids": self.centroids,
+            "ivf_offsets": self.offsets,
+            "ivf_ids": self.ids,
+        }
+
+    @classmethod
+    def from_artefact(
+        cls, sections: dict[str, np.ndarray], params: dict[str, Any], db_dir: str
+    ) -> "IVFBackend":
+        """Rebuild the backend from the artefact it was saved with."""
+        return cls(
+            sections["ivf_centroids"], sections["ivf_offsets"], sections["ivf_ids"]
+        )
+
+
+class HNSWBackend(SearchBackend):
+    """Graph-based approximate search with hnswlib.
+
+    The graph holds its own float32 copy of the vectors, so candidates are
+    scored at full precision whatever the index's storage.
+    """
+
+    name = "hnsw"
+
+    def __init__(self, graph: Any, ef: int = SEARCH_HNSW_EF):
+        """Initialise the backend.
+
+        Args:
+            graph: The hnswlib index.
+            ef: Size of the dynamic candidate list searched per query.
+        """
+        self.graph = graph
+        self.ef = max(ef, 1)
+
+    @classmethod
+    def build(
+        cls, vectors: np.ndarray, m: int = 16, ef_construction: int = 200
+    ) -> "HNSWBackend":
+        """Build the graph over the vectors.
+
+        Args:
+            vectors: Array of shape (size, dimension) of normalised vectors.
+            m: Number of links per node.
+            ef_construction: Size of the candidate list used while building.
+
+        Returns:
+            HNSWBackend: The backend over the vectors.
+        """
+        graph = _hnswlib().Index(space="ip", dim=vectors.shape[1])
+        graph.init_index(
+            max_elements=vectors.shape[0], ef_construction=ef_construction, M=m
+        )
+        graph.add_items(vectors, np.arange(vectors.shape[0]))
+        return cls(graph)
+
+    def search(
+        self, storage: VectorStorage, queries: np.ndarray, k: int
+    ) -> tuple[np.ndarray, np.ndarray]:
+        """Find the best scoring rows for each query vector."""
+        self.graph.set_ef(max(self.ef, k))
+        ids, distances = self.graph.knn_query(queries, k=k)
+        return (1.0 - distances).astype(np.float32), ids.astype(np.int64)
+
+    def params(self) -> dict[str, Any]:
+        """Return the parameters recorded in the artefact header."""
+        return {"file": HNSW_INDEX_FILE, "dimension": int(self.graph.dim)}
+
+    def save_files(self, db_dir: str) -> None:
+        """Write the graph next to the artefact."""
+        self.graph.save_index(os.path.join(db_dir, HNSW_INDEX_FILE))
+
+    @property
+    def nbytes(self) -> int:
+        """Number of bytes used by the graph, as written to disk."""
+        return 0
+
+    @classmethod
+    def from_artefact(
+        cls, sections: dict[str, np.ndarray], params: dict[str, Any], db_dir: str
+    ) -> "HNSWBackend":
+        """Load the graph saved alongside the artefact."""
+        graph = _hnswlib().Index(space="ip", dim=params["dimension"])
+        graph.load_index(os.path.join(db_dir, params["file"]))
+        return cls(graph)
+
+
+SEARCH_BACKENDS: dict[str, type[SearchBackend]] = {
+    backend.name: backend for backend in (FlatBackend, IVFBackend, HNSWBackend)
+}
+
+
+def build_backend(
+    vectors: np.ndarray,
+    name: str,
+    ivf_lists: int = 0,
+    hnsw_m: int = 16,
+    hnsw_ef_construction: int = 200,
+) -> SearchBackend:
+    """Build the named search backend over a set of vectors.
+
+    Args:
+        vectors: Array of shape (size, dimension) of normalised vectors.
+        name: One of flat, ivf or hnsw.
+        ivf_lists: Number of ivf lists. Defaults to the square root of the size.
+        hnsw_m: Number of links per hnsw node.
+        hnsw_ef_construction: Size of the hnsw candidate list while building.
+
+    Returns:
+        SearchBackend: The backend over the vectors.
+
+    Raises:
+        ValueError: If the backend is not supported.
+    """
+    if name == FlatBackend.name:
+        return FlatBackend()
+    if name == IVFBackend.name:
+        return IVFBackend.build(vectors, ivf_lists)
+    if name == HNSWBackend.name:
+        return HNSWBackend.build(vectors, hnsw_m, hnsw_ef_construction)
+    raise ValueError(
+        f"Unsupported search backend '{name}', expected one of {sorted(SEARCH_BACKENDS)}"
+    )
+
+
+def top_k(scores: np.ndarray, k: int) -> np.ndarray:
+    """Return the column ids of each row's k highest scores, highest first.
+
+    Args:
+        scores: Array of shape (n, columns).
+        k: Number of columns to select, at most the number of columns.
+
+    Returns:
+        np.ndarray: Array of shape (n, k) of column ids.
+    """
+    top = np.argpartition(-scores, k - 1, axis=1)[:, :k]
+    order = np.argsort(-np.take_along_axis(scores, top, axis=1), axis=1, kind="stable")
+    return np.take_along_axis(top, order, axis=1)
+
+
+def _hnswlib():
+    """Return the hnswlib module, which is an optional dependency."""
+    if hnswlib is None:
+        raise RuntimeError("The hnsw search backend requires hnswlib to be installed")
+    return hnswlib
@@ -7,9 +7,16 @@ it logs a warning and skips the build process.
 
 import os
 
+import pandas as pd
 from industrial_classification_utils.embed import EmbeddingHandler
 from survey_assist_utils.logging import get_logger
 
+from sic_classification_vector_store.utils.ann import build_backend
+from sic_classification_vector_store.utils.common import safe_bool, safe_int
+from sic_classification_vector_store.utils.encoder import SentenceEncoder
+from sic_classification_vector_store.utils.quantisation import quantise
+from sic_classification_vector_store.utils.search_index import SearchIndex
+
 logger = get_logger(__name__, level="DEBUG")
 
 
@@ -18,17 +25,63 @@ VECTOR_STORE_DIR = os.getenv(
     "VECTOR_STORE_DIR", "src/sic_classification_vector_store/data/vector_store"
 )
 INDEX_SOURCE_FILE = os.getenv("INDEX_SOURCE_FILE", None)
+SEARCH_INDEX_STORAGE = os.getenv("SEARCH_INDEX_STORAGE", "float32")
+SEARCH_INDEX_PQ_SUBVECTORS = safe_int(
+    os.getenv("SEARCH_INDEX_PQ_SUBVECTORS"), default=0
+)
+SEARCH_INDEX_KEEP_FULL_PRECISION = safe_bool(
+    os.getenv("SEARCH_INDEX_KEEP_FULL_PRECISION"), default=True
+)
+SEARCH_INDEX_BACKEND = os.getenv("SEARCH_INDEX_BACKEND", "flat")
+SEARCH_INDEX_IVF_LISTS = safe_int(os.getenv("SEARCH_INDEX_IVF_LISTS"), default=0)
+SEARCH_INDEX_HNSW_M = safe_int(os.getenv("SEARCH_INDEX_HNSW_M"), default=16)
+SEARCH_INDEX_HNSW_EF_CONSTRUCTION = safe_int(
+    os.getenv("SEARCH_INDEX_HNSW_EF_CONSTRUCTION"), default=200
+)
 
 
 def build_vector_store_index(db_dir: str, index_source_file: str) -> None:
     """Build the vector store from the given index source file.
 
+    Alongside the embedding handler's store this writes the memory-mapped
+    search index artefact that the API loads at start-up, with its vectors
+    stored in the precision set by SEARCH_INDEX_STORAGE and searched with the
+    backend set by SEARCH_INDEX_BACKEND.
+
     Args:
         db_dir: Directory to write the vector store into.
         index_source_file: Path to the CSV source file.
     """
     logger.info(f"Building vector store from index source file: {index_source_file}")
-    EmbeddingHandler(db_dir=db_dir, index_source_file=index_source_file)
+    embed = EmbeddingHandler(db_dir=db_dir, index_source_file=index_source_file)
+    embed_config = embed.get_embed_config()
+
+    logger.info("Building search index")
+    source = pd.read_csv(index_source_file, dtype=str, keep_default_na=False)
+    encoder = SentenceEncoder(embed_config.embedding_model_name)
+    vectors = encoder.encode(source["text"].tolist())
+    logger.info(f"Storing search index vectors as {SEARCH_INDEX_STORAGE}")
+    storage = quantise(
+        vectors, SEARCH_INDEX_STORAGE, pq_subvectors=SEARCH_INDEX_PQ_SUBVECTORS
+    )
+    logger.info(f"Building {SEARCH_INDEX_BACKEND} search backend")
+    backend = build_backend(
+        vectors,
+        SEARCH_INDEX_BACKEND,
+        ivf_lists=SEARCH_INDEX_IVF_LISTS,
+        hnsw_m=SEARCH_INDEX_HNSW_M,
+        hnsw_ef_construction=SEARCH_INDEX_HNSW_EF_CONSTRUCTION,
+    )
+    SearchIndex(
+        storage,
+        source["label"].tolist(),
+        source["text"].tolist(),
+        embedding_model_name=embed_config.embedding_model_name,
+        k_matches=embed_config.k_matches,
+        index_source_file=index_source_file,
+        full_vectors=vectors if SEARCH_INDEX_KEEP_FULL_PRECISION else None,
+        backend=backend,
+    ).save(db_dir)
     logger.info(f"Vector store built successfully. Directory: {db_dir}")
 
 
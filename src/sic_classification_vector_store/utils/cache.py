@@ -0,0 +1,251 @@
+"""Provides caching for vector store searches.
+
+This module contains the query normalisation used for cache keys, a bounded,
+thread-safe LRU cache of search results with an optional time-to-live and an
+array-backed cache of text embeddings.
+"""
+
+import re
+import time
+from collections import OrderedDict
+from collections.abc import Callable, Hashable, Sequence
+from threading import Lock
+from typing import Any
+
+import numpy as np
+
+_PUNCTUATION = re.compile(r"[^\w\s]")
+
+
+def normalise_text(text: str | None) -> str:
+    """Normalise free text for use in a cache key.
+
+    Text is lower-cased, punctuation is replaced by spaces and runs of
+    whitespace are collapsed.
+
+    Args:
+        text: The text to normalise.
+
+    Returns:
+        str: The normalised text.
+    """
+    return " ".join(_PUNCTUATION.sub(" ", (text or "").lower()).split())
+
+
+def normalise_query(query: Sequence[str | None]) -> tuple[str, ...]:
+    """Normalise each field of a query for use in a cache key.
+
+    Args:
+        query: The query fields.
+
+    Returns:
+        tuple: The normalised fields.
+    """
+    return tuple(normalise_text(field) for field in query)
+
+
+class ResultCache:
+    """Bounded LRU cache with an optional time-to-live for each entry."""
+
+    def __init__(self, max_size: int, ttl_seconds: float = 0):
+        """Initialise the cache.
+
+        Args:
+            max_size: Maximum number of entries. A size of 0 disables the cache.
+            ttl_seconds: Seconds before an entry expires. 0 means never.
+        """
+        self.max_size = max(max_size, 0)
+        self.ttl_seconds = max(ttl_seconds, 0)
+        self._entries: OrderedDict[Hashable, tuple[float, Any]] = OrderedDict()
+        self._lock = Lock()
+        self.hits = 0
+        self.misses = 0
+        # Incremented by clear, so results computed before it can be dropped
+        self.generation = 0
+
+    @property
+    def enabled(self) -> bool:
+        """Whether the cache stores any entries."""
+        return self.max_size > 0
+
+    def get(self, key: Hashable) -> Any | None:
+        """Look up a cached value.
+
+        Args:
+            key: The cache key.
+
+        Returns:
+            The cached value, or None if it is missing or has expired.
+        """
+        if not self.enabled:
+            return None
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is not None and self._expired(entry[0]):
+                del self._entries[key]
+                entry = None
+            if entry is None:
+                self.misses += 1
+                return None
+            self._entries.move_to_end(key)
+            self.hits += 1
+            return entry[1]
+
+    def put(self, key: Hashable, value: Any, generation: int | None = None) -> None:
+        """Store a value, evicting the least recently used entry when full.
+
+        Args:
+            key: The cache key.
+            value: The value to cache.
+            generation: The cache generation the value was computed in. The
+                value is dropped if the cache has been cleared since then.
+        """
+        if not self.enabled:
+            return
+        with self._lock:
+            if generation is not None and generation != self.generation:
+                return
+            self._entries[key] = (time.monotonic(), value)
+            self._entries.move_to_end(key)
+            while len(self._entries) > self.max_size:
+                self._entries.popitem(last=False)
+
+    def clear(self) -> None:
+        """Remove every entry, for example after the index is reloaded."""
+        with self._lock:
+            self._entries.clear()
+            self.generation += 1
+
+    def stats(self) -> dict[str, Any]:
+        """Return the cache size and hit/miss counters.
+
+        Returns:
+            dict: Whether the cache is enabled, its size, limit and counters.
+        """
+        with self._lock:
+            return {
+                "enabled": self.enabled,
+                "size": len(self._entries),
+                "max_size": self.max_size,
+                "hits": self.hits,
+                "misses": self.misses,
+            }
+
+    def __len__(self) -> int:
+        """Return the number of cached entries."""
+        return len(self._entries)
+
+    def _expired(self, stored_at: float) -> bool:
+        """Check whether an entry stored at the given time has expired."""
+        return bool(self.ttl_seconds) and (
+            time.monotonic() - stored_at > self.ttl_seconds
+        )
+
+
+class EmbeddingCache:
+    """Bounded LRU cache of text embeddings stored in one compact array.
+
+    Vectors live in a preallocated array of the configured dtype, with a
+    slot per cached text, rather than as one Python object per entry.
+    """
+
+    def __init__(self, max_size: int, dtype: str = "float32"):
+        """Initialise the cache.
+
+        Args:
+            max_size: Maximum number of cached texts. A size of 0 disables the cache.
+            dtype: Storage dtype of the cached vectors, float32 or float16.
+        """
+        self.max_size = max(max_size, 0)
+        self.dtype = np.dtype(dtype)
+        self._vectors: np.ndarray | None = None
+        self._slots: OrderedDict[str, int] = OrderedDict()
+        self._lock = Lock()
+        self.hits = 0
+        self.misses = 0
+        self._generation = 0
+
+    @property
+    def enabled(self) -> bool:
+        """Whether the cache stores any entries."""
+        return self.max_size > 0
+
+    def encode(
+        self, texts: list[str], encode: Callable[[list[str]], np.ndarray]
+    ) -> np.ndarray:
+        """Encode texts, only passing those not already cached to the encoder.
+
+        Args:
+            texts: The texts to encode.
+            encode: Function encoding a list of texts into a float32 array.
+
+        Returns:
+            np.ndarray: A float32 array with one row per text.
+        """
+        if not self.enabled or not texts:
+            return encode(texts)
+
+        with self._lock:
+            generation = self._generation
+            cached = {text: self._get(text) for text in dict.fromkeys(texts)}
+        missing = [text for text, vector in cached.items() if vector is None]
+        if missing:
+            encoded = encode(missing)
+            with self._lock:
+                for text, vector in zip(missing, encoded, strict=True):
+                    # Vectors from a model replaced during encoding are not kept
+                    if generation == self._generation:
+                        self._put(text, vector)
+                    cached[text] = vector
+        return np.vstack([cached[text] for text in texts]).astype(np.float32)
+
+    def clear(self) -> None:
+        """Remove every entry, for example after the model is reloaded."""
+        with self._lock:
+            self._slots.clear()
+            self._vectors = None
+            self._generation += 1
+
+    def stats(self) -> dict[str, Any]:
+        """Return the cache size and hit/miss counters.
+
+        Returns:
+            dict: Whether the cache is enabled, its size, limit and counters.
+        """
+        with self._lock:
+            return {
+                "enabled": self.enabled,
+                "size": len(self._slots),
+                "max_size": self.max_size,
+                "hits": self.hits,
+                "misses": self.misses,
+            }
+
+    def __len__(self) -> int:
+        """Return the number of cached texts."""
+        return len(self._slots)
+
+    def _get(self, text: str) -> np.ndarray | None:
+        """Copy a cached vector out of the array, holding the lock."""
+        slot = self._slots.get(text)
+        if slot is None or self._vectors is None:
+            self.misses += 1
+            return None
+        self._slots.move_to_end(text)
+        self.hits += 1
+        return self._vectors[slot].astype(np.float32)
+
+    def _put(self, text: str, vector: np.ndarray) -> None:
+        """Store a vector in a free or evicted slot, holding the lock."""
+        if self._vectors is None or self._vectors.shape[1] != vector.shape[0]:
+            self._vectors = np.zeros((self.max_size, vector.shape[0]), self.dtype)
+            self._slots.clear()
+        slot = self._slots.get(text)
+        if slot is None:
+            if len(self._slots) < self.max_size:
+                slot = len(self._slots)
+            else:
+                _, slot = self._slots.popitem(last=False)
+            self._slots[text] = slot
+        self._slots.move_to_end(text)
+        self._vectors[slot] = vector
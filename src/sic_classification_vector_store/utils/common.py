@@ -20,3 +20,25 @@ def safe_int(value, default=0):
         return int(value)
     except (ValueError, TypeError):
         return default
+
+
+def safe_bool(value, default=False):
+    """Safely convert a value such as an environment variable to a boolean.
+
+    Args:
+        value: The value to be converted. Strings such as "true", "1" and "yes"
+            are truthy and "false", "0" and "no" are falsy, ignoring case.
+        default: The default value to return if conversion fails. Defaults to False.
+
+    Returns:
+        bool: The converted boolean value, or the default value if conversion fails.
+    """
+    if isinstance(value, bool):
+        return value
+    if isinstance(value, str):
+        normalised = value.strip().lower()
+        if normalised in {"true", "1", "yes", "on"}:
+            return True
+        if normalised in {"false", "0", "no", "off"}:
+            return False
+    return default
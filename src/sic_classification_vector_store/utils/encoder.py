@@ -0,0 +1,90 @@
+"""Provides batched text encoding for the vector store.
+
+This module wraps the sentence-transformer embedding model so that many query
+strings can be encoded in a single forward pass.
+"""
+
+import os
+
+import numpy as np
+import torch
+from transformers import AutoModel, AutoTokenizer
+
+from sic_classification_vector_store.utils.common import safe_int
+
+# Configuration from environment variables with defaults
+ENCODE_BATCH_SIZE = safe_int(os.getenv("ENCODE_BATCH_SIZE"), default=256)
+
+
+def resolve_model_name(model_name: str) -> str:
+    """Resolve a short sentence-transformer model name to its HuggingFace id.
+
+    Args:
+        model_name: Model name as reported by the embedding handler.
+
+    Returns:
+        str: The fully qualified HuggingFace model id.
+    """
+    if "/" in model_name:
+        return model_name
+    return f"sentence-transformers/{model_name}"
+
+
+class SentenceEncoder:
+    """Encode text with a sentence-transformer model using mean pooling.
+
+    Embeddings are L2 normalised so that a dot product between a query and
+    an index vector is their cosine similarity.
+    """
+
+    def __init__(self, model_name: str, batch_size: int = ENCODE_BATCH_SIZE):
+        """Initialise the encoder.
+
+        Args:
+            model_name: Name of the sentence-transformer model.
+            batch_size: Maximum number of texts passed through the model at once.
+        """
+        self.model_name = model_name
+        self.batch_size = max(batch_size, 1)
+        self.tokenizer = AutoTokenizer.from_pretrained(resolve_model_name(model_name))
+        self.model = AutoModel.from_pretrained(resolve_model_name(model_name))
+        self.model.eval()
+
+    def encode(self, texts: list[str]) -> np.ndarray:
+        """Encode a list of texts.
+
+        Args:
+            texts: The texts to encode.
+
+        Returns:
+            np.ndarray: A float32 array of shape (len(texts), dimension).
+        """
+        chunks = [
+            self._encode_chunk(texts[start : start + self.batch_size])
+            for start in range(0, len(texts), self.batch_size)
+        ]
+        if not chunks:
+            dimension = self.model.config.hidden_size
+            return np.empty((0, dimension), dtype=np.float32)
+        return np.vstack(chunks)
+
+    def _encode_chunk(self, texts: list[str]) -> np.ndarray:
+        """Encode a single chunk of texts in one forward pass."""
+        encoded = self.tokenizer(
+            texts, padding=True, truncation=True, return_tensors="pt"
+        )
+        with torch.inference_mode():
+            token_embeddings = self.model(**encoded).last_hidden_state
+        mask = encoded["attention_mask"].unsqueeze(-1).to(token_embeddings.dtype)
+        pooled = (token_embeddings * mask).sum(dim=1) / mask.sum(dim=1).clamp(min=1e-9)
+        normalised = torch.nn.functional.normalize(pooled, p=2, dim=1)
+        return normalised.cpu().numpy().astype(np.float32, copy=False)
+
+
+def set_inference_threads(threads: int) -> None:
+    """Limit the number of threads used by the model for inference.
+
+    Args:
+        threads: Number of intra-op threads, at least 1.
+    """
+    torch.set_num_threads(max(threads, 1))
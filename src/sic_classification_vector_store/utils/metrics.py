@@ -0,0 +1,294 @@
+"""Provides Prometheus-style metrics for the vector store.
+
+This module contains minimal thread-safe counters, gauges and histograms that
+render in the Prometheus text exposition format, the registry of the vector
+store's metrics and the per-request stage timings reported in Server-Timing
+headers.
+"""
+
+import bisect
+import math
+import os
+import time
+from collections.abc import Iterator, Sequence
+from contextlib import contextmanager
+from contextvars import ContextVar
+from threading import Lock
+
+from sic_classification_vector_store.utils.common import safe_bool
+
+# Configuration from environment variables with defaults
+METRICS_ENABLED = safe_bool(os.getenv("METRICS_ENABLED"), default=True)
+SERVER_TIMING_ENABLED = safe_bool(os.getenv("SERVER_TIMING_ENABLED"), default=False)
+
+CONTENT_TYPE = "text/plain; version=0.0.4; charset=utf-8"
+DEFAULT_BUCKETS = (
+    0.0005,
+    0.001,
+    0.0025,
+    0.005,
+    0.01,
+    0.025,
+    0.05,
+    0.1,
+    0.25,
+    0.5,
+    1.0,
+    2.5,
+    5.0,
+    10.0,
+)
+
+# Stage durations of the current request, in seconds, when it is being timed
+stage_timings: ContextVar[dict[str, float] | None] = ContextVar(
+    "stage_timings", default=None
+)
+
+LabelValues = tuple[str, ...]
+
+
+class _Metric:
+    """Base class for the metric types."""
+
+    kind = ""
+
+    def __init__(self, name: str, documentation: str, labelnames: Sequence[str] = ()):
+        """Initialise the metric.
+
+        Args:
+            name: Metric name.
+            documentation: Help text of the metric.
+            labelnames: Names of the metric's labels.
+        """
+        self.name = name
+        self.documentation = documentation
+        self.labelnames = tuple(labelnames)
+        self._lock = Lock()
+
+    def render(self) -> list[str]:
+        """Render the metric in the Prometheus text format."""
+        return [
+            f"# HELP {self.name} {self.documentation}",
+            f"# TYPE {self.name} {self.kind}",
+            *self._samples(),
+        ]
+
+    def _samples(self) -> list[str]:
+        """Render the metric's sample lines."""
+        raise NotImplementedError
+
+    def _labels(self, values: LabelValues, extra: str = "") -> str:
+        """Format label values, with an optional extra label, for a sample."""
+        pairs = [
+            f'{name}="{_escape(value)}"'
+            for name, value in zip(self.labelnames, values, strict=True)
+        ]
+        if extra:
+            pairs.append(extra)
+        return "{" + ",".join(pairs) + "}" if pairs else ""
+
+
+class _Value(_Metric):
+    """Base class for metrics holding a single value per label set."""
+
+    def __init__(self, name: str, documentation: str, labelnames: Sequence[str] = ()):
+        """Initialise the metric."""
+        super().__init__(name, documentation, labelnames)
+        self._values: dict[LabelValues, float] = {}
+
+    def inc(self, *labelvalues: str, amount: float = 1) -> None:
+        """Increment the value for the given label values."""
+        with self._lock:
+            self._values[labelvalues] = self._values.get(labelvalues, 0) + amount
+
+    def set(self, *labelvalues: str, value: float) -> None:
+        """Set the value for the given label values."""
+        with self._lock:
+            self._values[labelvalues] = value
+
+    def _samples(self) -> list[str]:
+        """Render the metric's sample lines."""
+        with self._lock:
+            values = dict(self._values)
+        return [
+            f"{self.name}{self._labels(labels)} {_number(value)}"
+            for labels, value in values.items()
+        ]
+
+
+class Counter(_Value):
+    """Monotonically increasing total.
+
+    Totals kept elsewhere, such as the cache counters, are copied in with set.
+    """
+
+    kind = "counter"
+
+
+class Gauge(_Value):
+    """Value that can go up and down."""
+
+    kind = "gauge"
+
+    def dec(self, *labelvalues: str, amount: float = 1) -> None:
+        """Decrement the gauge for the given label values."""
+        self.inc(*labelvalues, amount=-amount)
+
+
+class Histogram(_Metric):
+    """Distribution of observed values in cumulative buckets."""
+
+    kind = "histogram"
+
+    def __init__(
+        self,
+        name: str,
+        documentation: str,
+        labelnames: Sequence[str] = (),
+        buckets: Sequence[float] = DEFAULT_BUCKETS,
+    ):
+        """Initialise the histogram.
+
+        Args:
+            name: Metric name.
+            documentation: Help text of the metric.
+            labelnames: Names of the metric's labels.
+            buckets: Upper bounds of the buckets, in increasing order.
+        """
+        super().__init__(name, documentation, labelnames)
+        self.buckets = tuple(sorted(buckets))
+        self._values: dict[LabelValues, tuple[list[int], float]] = {}
+
+    def observe(self, value: float, *labelvalues: str) -> None:
+        """Record an observation for the given label values."""
+        with self._lock:
+            counts, total = self._values.get(
+                labelvalues, ([0] * (len(self.buckets) + 1), 0.0)
+            )
+            counts[bisect.bisect_left(self.buckets, value)] += 1
+            self._values[labelvalues] = (counts, total + value)
+
+    def _samples(self) -> list[str]:
+        """Render the histogram's bucket, sum and count lines."""
+        with self._lock:
+            values = {labels: (list(c), t) for labels, (c, t) in self._values.items()}
+        lines = []
+        for labels, (counts, total) in values.items():
+            cumulative = 0
+            for bound, count in zip((*self.buckets, math.inf), counts, strict=True):
+                cumulative += count
+                le = f'le="{_number(bound)}"'
+                lines.append(
+                    f"{self.name}_bucket{self._labels(labels, le)} {cumulative}"
+                )
+            lines.append(f"{self.name}_sum{self._labels(labels)} {_number(total)}")
+            lines.append(f"{self.name}_count{self._labels(labels)} {cumulative}")
+        return lines
+
+
+class MetricsRegistry:
+    """Collection of metrics rendered together."""
+
+    def __init__(self):
+        """Initialise an empty registry."""
+        self.metrics: list[_Metric] = []
+
+    def register(self, metric: _Metric) -> _Metric:
+        """Add a metric to the registry and return it."""
+        self.metrics.append(metric)
+        return metric
+
+    def render(self) -> str:
+        """Render every metric in the Prometheus text format."""
+        return "".join(
+            f"{line}\n" for metric in self.metrics for line in metric.render()
+        )
+
+
+registry = MetricsRegistry()
+SEARCH_STAGE_SECONDS = Histogram(
+    "sic_vector_store_search_stage_seconds",
+    "Time spent in each stage of a search.",
+    ("stage",),
+)
+REQUEST_SECONDS = Histogram(
+    "sic_vector_store_request_seconds",
+    "Time to serve an HTTP request.",
+    ("route", "status"),
+)
+REQUESTS_IN_FLIGHT = Gauge(
+    "sic_vector_store_requests_in_flight", "HTTP requests currently being served."
+)
+LOAD_SECONDS = Gauge(
+    "sic_vector_store_load_seconds", "Time taken by the last vector store load."
+)
+INDEX_ENTRIES = Gauge(
+    "sic_vector_store_index_entries", "Number of entries in the loaded index."
+)
+CACHE_ENTRIES = Gauge(
+    "sic_vector_store_cache_entries", "Number of entries in a cache.", ("cache",)
+)
+CACHE_HITS = Counter(
+    "sic_vector_store_cache_hits_total", "Number of cache hits.", ("cache",)
+)
+CACHE_MISSES = Counter(
+    "sic_vector_store_cache_misses_total", "Number of cache misses.", ("cache",)
+)
+for _metric in (
+    SEARCH_STAGE_SECONDS,
+    REQUEST_SECONDS,
+    REQUESTS_IN_FLIGHT,
+    LOAD_SECONDS,
+    INDEX_ENTRIES,
+    CACHE_ENTRIES,
+    CACHE_HITS,
+    CACHE_MISSES,
+):
+    registry.register(_metric)
+
+
+def record_stage(stage: str, seconds: float) -> None:
+    """Record the duration of a search stage.
+
+    The duration is observed in the stage histogram and added to the current
+    request's stage timings when the request is being timed.
+
+    Args:
+        stage: Name of the stage.
+        seconds: Duration of the stage.
+    """
+    if not METRICS_ENABLED:
+        return
+    SEARCH_STAGE_SECONDS.observe(seconds, stage)
+    timings = stage_timings.get()
+    if timings is not None:
+        timings[stage] = timings.get(stage, 0.0) + seconds
+
+
+@contextmanager
+def timed_stage(stage: str) -> Iterator[None]:
+    """Record the duration of the enclosed block as a search stage."""
+    start = time.perf_counter()
+    try:
+        yield
+    finally:
+        record_stage(stage, time.perf_counter() - start)
+
+
+def server_timing(timings: dict[str, float]) -> str:
+    """Format stage timings as a Server-Timing header value in milliseconds."""
+    return ", ".join(
+        f"{stage};dur={seconds * 1000:.3f}" for stage, seconds in timings.items()
+    )
+
+
+def _escape(value: str) -> str:
+    """Escape a label value for the text format."""
+    return value.replace("\\", "\\\\").replace("\n", "\\n").replace('"', '\\"')
+
+
+def _number(value: float) -> str:
+    """Format a sample value for the text format."""
+    if math.isinf(value):
+        return "+Inf" if value > 0 else "-Inf"
+    return repr(float(value))
@@ -0,0 +1,387 @@
+"""Provides the vector storage precisions used by the search index.
+
+Each storage holds the index vectors in one precision and scores query
+vectors against them:
+
+    float32: full precision vectors, exact scores
+    float16: half precision vectors, half the memory with negligible error
+    int8: scalar quantisation with a per-dimension scale, a quarter of the memory
+    pq: product quantisation, one byte per sub-vector, the smallest footprint
+
+Lossy storages score approximately, so the search index can re-rank their top
+candidates against full precision vectors.
+"""
+
+from typing import Any, ClassVar
+
+import numpy as np
+
+# Rows converted to float32 at a time when scoring a compact storage
+SCORE_CHUNK_ROWS = 65536
+PQ_CENTROIDS = 256
+
+
+class VectorStorage:
+    """Base class for the vector storage precisions."""
+
+    mode: ClassVar[str] = ""
+    lossy: ClassVar[bool] = True
+
+    def __len__(self) -> int:
+        """Return the number of stored vectors."""
+        raise NotImplementedError
+
+    @property
+    def dimension(self) -> int:
+        """Dimension of the stored vectors."""
+        raise NotImplementedError
+
+    @property
+    def nbytes(self) -> int:
+        """Number of bytes used by the stored arrays."""
+        return int(sum(array.nbytes for array in self.sections().values()))
+
+    def scores(self, queries: np.ndarray, rows: np.ndarray | None = None) -> np.ndarray:
+        """Score query vectors against the stored vectors.
+
+        Args:
+            queries: float32 array of shape (n, dimension) of query vectors.
+            rows: Optional row ids restricting the vectors that are scored.
+
+        Returns:
+            np.ndarray: float32 array of shape (n, len(rows)) of dot products.
+        """
+        raise NotImplementedError
+
+    def params(self) -> dict[str, Any]:
+        """Return the parameters recorded in the artefact header."""
+        return {}
+
+    def sections(self) -> dict[str, np.ndarray]:
+        """Return the arrays written to the artefact, by section name."""
+        raise NotImplementedError
+
+    @classmethod
+    def from_sections(
+        cls, sections: dict[str, np.ndarray], params: dict[str, Any]
+    ) -> "VectorStorage":
+        """Rebuild the storage from the artefact's sections and parameters."""
+        raise NotImplementedError
+
+
+class Float32Storage(VectorStorage):
+    """Full precision vectors."""
+
+    mode = "float32"
+    lossy = False
+
+    def __init__(self, vectors: np.ndarray):
+        """Initialise the storage.
+
+        Args:
+            vectors: Array of shape (size, dimension) of normalised vectors.
+        """
+        self.vectors = (
+            vectors if vectors.dtype == np.float32 else vectors.astype(np.float32)
+        )
+
+    def __len__(self) -> int:
+        """Return the number of stored vectors."""
+        return self.vectors.shape[0]
+
+    @property
+    def dimension(self) -> int:
+        """Dimension of the stored vectors."""
+        return self.vectors.shape[1]
+
+    def scores(self, queries: np.ndarray, rows: np.ndarray | None = None) -> np.ndarray:
+        """Score query vectors against the stored vectors."""
+        vectors = self.vectors if rows is None else self.vectors[rows]
+        return queries @ vectors.T
+
+    def sections(self) -> dict[str, np.ndarray]:
+        """Return the arrays written to the artefact, by section name."""
+        return {"vectors": self.vectors}
+
+    @classmethod
+    def from_sections(
+        cls, sections: dict[str, np.ndarray], params: dict[str, Any]
+    ) -> "Float32Storage":
+        """Rebuild the storage from the artefact's sections and parameters."""
+        return cls(sections["vectors"])
+
+
+class Float16Storage(VectorStorage):
+    """Half precision vectors."""
+
+    mode = "float16"
+
+    def __init__(self, vectors: np.ndarray):
+        """Initialise the storage.
+
+        Args:
+            vectors: Array of shape (size, dimension) of normalised vectors.
+        """
+        self.vectors = vectors.astype(np.float16, copy=False)
+
+    def __len__(self) -> int:
+        """Return the number of stored vectors."""
+        return self.vectors.shape[0]
+
+    @property
+    def dimension(self) -> int:
+        """Dimension of the stored vectors."""
+        return self.vectors.shape[1]
+
+    def scores(self, queries: np.ndarray, rows: np.ndarray | None = None) -> np.ndarray:
+        """Score query vectors against the stored vectors."""
+        vectors = self.vectors if rows is None else self.vectors[rows]
+        return _chunked_scores(queries, vectors, lambda chunk: chunk.astype(np.float32))
+
+    def sections(self) -> dict[str, np.ndarray]:
+        """Return the arrays written to the artefact, by section name."""
+        return {"vectors": self.vectors}
+
+    @classmethod
+    def from_sections(
+        cls, sections: dict[str, np.ndarray], params: dict[str, Any]
+    ) -> "Float16Storage":
+        """Rebuild the storage from the artefact's sections and parameters."""
+        return cls(sections["vectors"])
+
+
+class Int8Storage(VectorStorage):
+    """Symmetric scalar quantisation to int8 with a scale per dimension."""
+
+    mode = "int8"
+
+    def __init__(self, codes: np.ndarray, scales: np.ndarray):
+        """Initialise the storage.
+
+        Args:
+            codes: int8 array of shape (size, dimension).
+            scales: float32 array of shape (dimension,) mapping codes back to values.
+        """
+        self.codes = codes
+        self.scales = scales
+
+    @classmethod
+    def quantise(cls, vectors: np.ndarray) -> "Int8Storage":
+        """Quantise float vectors.
+
+        Args:
+            vectors: Array of shape (size, dimension) of normalised vectors.
+
+        Returns:
+            Int8Storage: The quantised storage.
+        """
+        scales = np.abs(vectors).max(axis=0).astype(np.float32) / 127
+        scales[scales == 0] = 1.0
+        codes = np.clip(np.rint(vectors / scales), -127, 127).astype(np.int8)
+        return cls(codes, scales)
+
+    def __len__(self) -> int:
+        """Return the number of stored vectors."""
+        return self.codes.shape[0]
+
+    @property
+    def dimension(self) -> int:
+        """Dimension of the stored vectors."""
+        return self.codes.shape[1]
+
+    def scores(self, queries: np.ndarray, rows: np.ndarray | None = None) -> np.ndarray:
+        """Score query vectors against the stored vectors."""
+        codes = self.codes if rows is None else self.codes[rows]
+        return _chunked_scores(
+            queries * self.scales, codes, lambda chunk: chunk.astype(np.float32)
+        )
+
+    def sections(self) -> dict[str, np.ndarray]:
+        """Return the arrays written to the artefact, by section name."""
+        return {"int8_codes": self.codes, "int8_scales": self.scales}
+
+    @classmethod
+    def from_sections(
+        cls, sections: dict[str, np.ndarray], params: dict[str, Any]
+    ) -> "Int8Storage":
+        """Rebuild the storage from the artefact's sections and parameters."""
+        return cls(sections["int8_codes"], sections["int8_scales"])
+
+
+class ProductQuantStorage(VectorStorage):
+    """Product quantisation with one byte per sub-vector.
+
+    Vectors are split into equal sub-vectors and each is replaced by its
+    nearest centroid in a per-subspace codebook. Queries are scored with
+    lookup tables of their dot products with every centroid.
+    """
+
+    mode = "pq"
+
+    def __init__(self, codes: np.ndarray, codebooks: np.ndarray):
+        """Initialise the storage.
+
+        Args:
+            codes: uint8 array of shape (size, subvectors) of centroid ids.
+            codebooks: float32 array of shape (subvectors, centroids, subdimension).
+        """
+        self.codes = codes
+        self.codebooks = codebooks
+
+    @classmethod
+    def quantise(
+        cls, vectors: np.ndarray, subvectors: int, iterations: int = 20, seed: int = 0
+    ) -> "ProductQuantStorage":
+        """Train codebooks on the vectors and encode them.
+
+        Args:
+            vectors: Array of shape (size, dimension) of normalised vectors.
+            subvectors: Number of sub-vectors, which must divide the dimension.
+            iterations: Number of k-means iterations per subspace.
+            seed: Seed for the k-means initialisation.
+
+        Returns:
+            ProductQuantStorage: The quantised storage.
+
+        Raises:
+            ValueError: If subvectors does not divide the vector dimension.
+        """
+        size, dimension = vectors.shape
+        if subvectors <= 0 or dimension % subvectors:
+            raise ValueError(
+                f"PQ sub-vectors ({subvectors}) must divide the dimension ({dimension})"
+            )
+        split = vectors.astype(np.float32).reshape(size, subvectors, -1)
+        centroids = min(PQ_CENTROIDS, size)
+        codebooks = np.stack(
+            [
+                kmeans(split[:, j], centroids, iterations=iterations, seed=seed)
+                for j in range(subvectors)
+            ]
+        )
+        codes = np.stack(
+            [nearest_centroid(split[:, j], codebooks[j]) for j in range(subvectors)],
+            axis=1,
+        ).astype(np.uint8)
+        return cls(codes, codebooks)
+
+    def __len__(self) -> int:
+        """Return the number of stored vectors."""
+        return self.codes.shape[0]
+
+    @property
+    def dimension(self) -> int:
+        """Dimension of the stored vectors."""
+        return self.codebooks.shape[0] * self.codebooks.shape[2]
+
+    def scores(self, queries: np.ndarray, rows: np.ndarray | None = None) -> np.ndarray:
+        """Score query vectors against the stored vectors."""
+        codes = self.codes if rows is None else self.codes[rows]
+        subvectors = self.codebooks.shape[0]
+        tables = np.einsum(
+            "nmd,mcd->nmc",
+            queries.reshape(queries.shape[0], subvectors, -1),
+            self.codebooks,
+        )
+        scores = np.zeros((queries.shape[0], codes.shape[0]), dtype=np.float32)
+        for j in range(subvectors):
+            scores += tables[:, j, codes[:, j]]
+        return scores
+
+    def params(self) -> dict[str, Any]:
+        """Return the parameters recorded in the artefact header."""
+        return {"subvectors": int(self.codebooks.shape[0])}
+
+    def sections(self) -> dict[str, np.ndarray]:
+        """Return the arrays written to the artefact, by section name."""
+        return {"pq_codes": self.codes, "pq_codebooks": self.codebooks}
+
+    @classmethod
+    def from_sections(
+        cls, sections: dict[str, np.ndarray], params: dict[str, Any]
+    ) -> "ProductQuantStorage":
+        """Rebuild the storage from the artefact's sections and parameters."""
+        return cls(sections["pq_codes"], sections["pq_codebooks"])
+
+
+STORAGE_MODES: dict[str, type[VectorStorage]] = {
+    storage.mode: storage
+    for storage in (Float32Storage, Float16Storage, Int8Storage, ProductQuantStorage)
+}
+
+
+def quantise(vectors: np.ndarray, mode: str, pq_subvectors: int = 0) -> VectorStorage:
+    """Store vectors in the given precision.
+
+    Args:
+        vectors: Array of shape (size, dimension) of normalised vectors.
+        mode: One of float32, float16, int8 or pq.
+        pq_subvectors: Number of PQ sub-vectors. Defaults to one per 8 dimensions.
+
+    Returns:
+        VectorStorage: The vectors in the requested storage.
+
+    Raises:
+        ValueError: If the mode is not supported.
+    """
+    if mode == Float32Storage.mode:
+        return Float32Storage(vectors)
+    if mode == Float16Storage.mode:
+        return Float16Storage(vectors)
+    if mode == Int8Storage.mode:
+        return Int8Storage.quantise(vectors)
+    if mode == ProductQuantStorage.mode:
+        subvectors = pq_subvectors or max(vectors.shape[1] // 8, 1)
+        return ProductQuantStorage.quantise(vectors, subvectors)
+    raise ValueError(
+        f"Unsupported vector storage '{mode}', expected one of {sorted(STORAGE_MODES)}"
+    )
+
+
+def kmeans(data: np.ndarray, k: int, iterations: int = 20, seed: int = 0) -> np.ndarray:
+    """Cluster rows with Lloyd's k-means.
+
+    Args:
+        data: float32 array of shape (size, dimension).
+        k: Number of clusters, at most the number of rows.
+        iterations: Number of assignment and update steps.
+        seed: Seed for choosing the initial centroids.
+
+    Returns:
+        np.ndarray: float32 array of shape (k, dimension) of centroids.
+    """
+    rng = np.random.default_rng(seed)
+    centroids = data[rng.choice(data.shape[0], size=k, replace=False)].copy()
+    for _ in range(iterations):
+        assignment = nearest_centroid(data, centroids)
+        counts = np.bincount(assignment, minlength=k)
+        sums = np.zeros_like(centroids)
+        np.add.at(sums, assignment, data)
+        filled = counts > 0
+        centroids[filled] = sums[filled] / counts[filled, None]
+    return centroids.astype(np.float32)
+
+
+def nearest_centroid(data: np.ndarray, centroids: np.ndarray) -> np.ndarray:
+    """Assign each row to its nearest centroid by Euclidean distance.
+
+    Args:
+        data: Array of shape (size, dimension).
+        centroids: Array of shape (k, dimension).
+
+    Returns:
+        np.ndarray: Array of shape (size,) of centroid ids.
+    """
+    distances = (
+        -2 * data @ centroids.T + np.einsum("kd,kd->k", centroids, centroids)[None, :]
+    )
+    return np.argmin(distances, axis=1)
+
+
+def _chunked_scores(queries: np.ndarray, vectors: np.ndarray, convert) -> np.ndarray:
+    """Score queries against compact vectors, converting a chunk at a time."""
+    scores = np.empty((queries.shape[0], vectors.shape[0]), dtype=np.float32)
+    for start in range(0, vectors.shape[0], SCORE_CHUNK_ROWS):
+        chunk = convert(vectors[start : start + SCORE_CHUNK_ROWS])
+        scores[:, start : start + chunk.shape[0]] = queries @ chunk.T
+    return scores
@@ -0,0 +1,92 @@
+"""Provides a bounded thread pool for running searches off the event loop.
+
+Searches are CPU bound and synchronous, so the API hands them to this
+executor and awaits the result. The number of queued searches is capped so
+that an overloaded instance rejects work quickly instead of building an
+unbounded backlog.
+"""
+
+import asyncio
+import contextvars
+import time
+from collections.abc import Callable
+from concurrent.futures import Future, ThreadPoolExecutor
+from threading import BoundedSemaphore
+from typing import Any, TypeVar
+
+from sic_classification_vector_store.utils.metrics import record_stage
+
+T = TypeVar("T")
+
+
+class SearchQueueFullError(Exception):
+    """Raised when the search executor cannot accept more work."""
+
+
+class SearchExecutor:
+    """Thread pool with a bounded queue of pending searches."""
+
+    def __init__(self, max_workers: int, queue_size: int):
+        """Initialise the search executor.
+
+        Args:
+            max_workers: Number of threads running searches.
+            queue_size: Number of searches allowed to wait for a free thread.
+        """
+        self.max_workers = max(max_workers, 1)
+        self.queue_size = max(queue_size, 0)
+        self._slots = BoundedSemaphore(self.max_workers + self.queue_size)
+        self._pool = ThreadPoolExecutor(
+            max_workers=self.max_workers, thread_name_prefix="search"
+        )
+
+    def submit(self, fn: Callable[..., T], *args: Any, **kwargs: Any) -> Future[T]:
+        """Submit a search to the pool without blocking.
+
+        Args:
+            fn: The callable to run.
+            *args: Positional arguments for fn.
+            **kwargs: Keyword arguments for fn.
+
+        Returns:
+            Future: The future of the submitted call.
+
+        Raises:
+            SearchQueueFullError: If all workers are busy and the queue is full.
+        """
+        if not self._slots.acquire(blocking=False):
+            raise SearchQueueFullError("Search queue is full, retry later")
+        submitted = time.perf_counter()
+
+        def call() -> T:
+            record_stage("queue", time.perf_counter() - submitted)
+            return fn(*args, **kwargs)
+
+        try:
+            # Run in a copy of the caller's context so stage timings reach it
+            future = self._pool.submit(contextvars.copy_context().run, call)
+        except BaseException:
+            self._slots.release()
+            raise
+        future.add_done_callback(lambda _: self._slots.release())
+        return future
+
+    async def run(self, fn: Callable[..., T], *args: Any, **kwargs: Any) -> T:
+        """Run a search in the pool and await its result.
+
+        Args:
+            fn: The callable to run.
+            *args: Positional arguments for fn.
+            **kwargs: Keyword arguments for fn.
+
+        Returns:
+            The return value of fn.
+
+        Raises:
+            SearchQueueFullError: If all workers are busy and the queue is full.
+        """
+        return await asyncio.wrap_future(self.submit(fn, *args, **kwargs))
+
+    def shutdown(self) -> None:
+        """Stop accepting searches and wait for running ones to finish."""
+        self._pool.shutdown(wait=True, cancel_futures=True)
@@ -0,0 +1,453 @@
+"""Provides a matrix search index over the embedded SIC index entries.
+
+This module holds the index vectors alongside their SIC metadata so that a
+batch of query vectors can be matched with a single matrix product. The index
+is persisted as a single versioned binary artefact that is memory-mapped when
+loaded, so start-up does not re-embed or deserialise the index and worker
+processes share its pages through the operating system's page cache.
+
+Artefact layout:
+    preamble: magic bytes, format version and header length
+    header: UTF-8 JSON describing the index, its storage precision, its
+        sections and their checksum
+    data: 64-byte aligned sections holding the stored vectors, an optional
+        full precision copy, the search backend's structures and the metadata
+        columns
+"""
+
+import hashlib
+import json
+import os
+import struct
+from collections.abc import Iterator, Sequence
+from datetime import UTC, datetime
+from typing import Any
+
+import numpy as np
+
+from sic_classification_vector_store.utils.ann import (
+    SEARCH_BACKENDS,
+    FlatBackend,
+    SearchBackend,
+    top_k,
+)
+from sic_classification_vector_store.utils.quantisation import (
+    STORAGE_MODES,
+    Float32Storage,
+    VectorStorage,
+)
+
+SEARCH_INDEX_FILE = "search_index.bin"
+SEARCH_INDEX_MAGIC = b"SICVSIDX"
+SEARCH_INDEX_FORMAT_VERSION = 2
+# Version 1 artefacts only hold float32 vectors and can still be read
+SUPPORTED_FORMAT_VERSIONS = {1, SEARCH_INDEX_FORMAT_VERSION}
+
+_PREAMBLE = struct.Struct("<8sIQ")
+_ALIGNMENT = 64
+_CHECKSUM_CHUNK_SIZE = 16 * 1024 * 1024
+
+
+class SearchIndexFormatError(ValueError):
+    """Raised when a search index artefact is invalid or corrupt."""
+
+
+class StringColumn:
+    """Read-only column of strings stored as UTF-8 bytes and row offsets.
+
+    Rows are decoded on access, so a memory-mapped column costs no Python
+    objects until a row is used.
+    """
+
+    def __init__(self, data: np.ndarray, offsets: np.ndarray):
+        """Initialise the column.
+
+        Args:
+            data: uint8 array of the concatenated UTF-8 encoded rows.
+            offsets: int64 array of len(rows) + 1 offsets into data.
+        """
+        self.data = data
+        self.offsets = offsets
+
+    @classmethod
+    def from_strings(cls, values: Sequence[str]) -> "StringColumn":
+        """Build a column from a sequence of strings.
+
+        Args:
+            values: The strings to store.
+
+        Returns:
+            StringColumn: The column holding the strings.
+        """
+        encoded = [value.encode("utf-8") for value in values]
+        offsets = np.zeros(len(encoded) + 1, dtype=np.int64)
+        np.cumsum([len(value) for value in encoded], out=offsets[1:])
+        data = np.frombuffer(b"".join(encoded), dtype=np.uint8)
+        return cls(data, offsets)
+
+    def __len__(self) -> int:
+        """Return the number of rows."""
+        return len(self.offsets) - 1
+
+    def __getitem__(self, row: int) -> str:
+        """Decode a single row."""
+        start, end = self.offsets[row], self.offsets[row + 1]
+        return bytes(self.data[start:end]).decode("utf-8")
+
+    def __iter__(self) -> Iterator[str]:
+        """Iterate over the decoded rows."""
+        return (self[row] for row in range(len(self)))
+
+    def tolist(self) -> list[str]:
+        """Decode every row into a list."""
+        return list(self)
+
+    @property
+    def nbytes(self) -> int:
+        """Number of bytes used by the column's arrays."""
+        return int(self.data.nbytes + self.offsets.nbytes)
+
+
+class SearchIndex:
+    """Nearest-neighbour index over L2 normalised embeddings.
+
+    Vectors are held in a configurable storage precision. Lossy storages can
+    keep a full precision copy, memory-mapped from the artefact, to re-rank
+    their top candidates. Distances are reported as cosine distances, so lower
+    values are closer matches.
+    """
+
+    def __init__(  # noqa: PLR0913 # pylint: disable=too-many-arguments
+        self,
+        vectors: np.ndarray | VectorStorage,
+        codes: Sequence[str] | StringColumn,
+        titles: Sequence[str] | StringColumn,
+        *,
+        embedding_model_name: str,
+        k_matches: int,
+        index_source_file: str = "",
+        checksum: str = "",
+        full_vectors: np.ndarray | None = None,
+        backend: SearchBackend | None = None,
+    ):
+        """Initialise the search index.
+
+        Args:
+            vectors: Array of shape (size, dimension) of normalised embeddings,
+                or the embeddings in a vector storage.
+            codes: SIC code for each row of vectors.
+            titles: Index text for each row of vectors.
+            embedding_model_name: Name of the model used to embed the index.
+            k_matches: Number of matches returned per query string.
+            index_source_file: Source file the index was built from.
+            checksum: Checksum of the artefact the index was loaded from.
+            full_vectors: Full precision embeddings used to re-rank the
+                candidates of a lossy storage.
+            backend: Backend finding the candidate rows. Defaults to an exact
+                flat scan.
+
+        Raises:
+            ValueError: If the metadata does not line up with the vectors.
+        """
+        storage = (
+            vectors if isinstance(vectors, VectorStorage) else Float32Storage(vectors)
+        )
+        if not len(codes) == len(titles) == len(storage):
+            raise ValueError("Search index metadata does not match the vectors")
+        self.storage = storage
+        if isinstance(storage, Float32Storage):
+            full_vectors = storage.vectors
+        self.full_vectors = full_vectors
+        self.backend = backend or FlatBackend()
+        self.codes = _as_column(codes)
+        self.titles = _as_column(titles)
+        self.embedding_model_name = embedding_model_name
+        self.k_matches = k_matches
+        self.index_source_file = index_source_file
+        self.checksum = checksum
+
+    def __len__(self) -> int:
+        """Return the number of entries in the index."""
+        return len(self.codes)
+
+    @property
+    def can_rerank(self) -> bool:
+        """Whether approximate scores can be re-ranked at full precision."""
+        return self.storage.lossy and self.full_vectors is not None
+
+    def search(
+        self, queries: np.ndarray, k: int, rerank_factor: int = 0
+    ) -> tuple[np.ndarray, np.ndarray]:
+        """Find the nearest index entries for each query vector.
+
+        Args:
+            queries: Array of shape (n, dimension) of normalised query vectors.
+            k: Number of matches to return per query.
+            rerank_factor: When the storage is lossy and full precision vectors
+                are available, re-rank the top k * rerank_factor approximate
+                candidates with exact scores. 0 disables re-ranking.
+
+        Returns:
+            tuple: Arrays of shape (n, k) holding the cosine distances and the
+                row ids of the matches, each row ordered closest first. An
+                approximate backend may find fewer than k matches, in which
+                case the row is padded with id -1 and an infinite distance.
+        """
+        k = min(k, len(self))
+        if k <= 0 or queries.shape[0] == 0:
+            empty = np.empty((queries.shape[0], 0))
+            return empty.astype(np.float32), empty.astype(np.int64)
+        if rerank_factor > 0 and self.storage.lossy and self.full_vectors is not None:
+            scores, candidates = self.backend.search(
+                self.storage, queries, min(k * rerank_factor, len(self))
+            )
+            vectors = self.full_vectors[np.maximum(candidates, 0)]
+            exact = np.einsum("nd,ncd->nc", queries, vectors)
+            exact[candidates < 0] = -np.inf
+            order = top_k(exact, k)
+            ids = np.take_along_axis(candidates, order, axis=1)
+            scores = np.take_along_axis(exact, order, axis=1)
+        else:
+            scores, ids = self.backend.search(self.storage, queries, k)
+        return 1.0 - scores, ids
+
+    def footprint(self) -> dict[str, Any]:
+        """Describe the storage mode and memory used by the index.
+
+        Returns:
+            dict: The search backend, storage mode, whether re-ranking is
+                available and the bytes used by the vectors, full precision
+                copy, backend structures and metadata.
+        """
+        full_precision_bytes = (
+            int(self.full_vectors.nbytes)
+            if self.full_vectors is not None and self.storage.lossy
+            else 0
+        )
+        return {
+            "backend": self.backend.name,
+            "storage": self.storage.mode,
+            "rerank": self.can_rerank,
+            "vectors_bytes": self.storage.nbytes,
+            "full_precision_bytes": full_precision_bytes,
+            "backend_bytes": self.backend.nbytes,
+            "metadata_bytes": self.codes.nbytes + self.titles.nbytes,
+        }
+
+    def result(self, row: int, distance: float) -> dict:
+        """Build the search result for a single index row.
+
+        Args:
+            row: Row id in the index.
+            distance: Cosine distance between the query and the row.
+
+        Returns:
+            dict: The search result in the embedding handler's response format.
+        """
+        code = self.codes[row]
+        return {
+            "distance": float(distance),
+            "title": self.titles[row],
+            "code": code,
+            "four_digit_code": code[:4],
+            "two_digit_code": code[:2],
+        }
+
+    @staticmethod
+    def exists(db_dir: str) -> bool:
+        """Check whether a search index artefact has been written to a directory.
+
+        Args:
+            db_dir: Directory of the vector store.
+
+        Returns:
+            bool: True if the artefact is present.
+        """
+        return os.path.isfile(os.path.join(db_dir, SEARCH_INDEX_FILE))
+
+    def save(self, db_dir: str) -> str:
+        """Write the search index artefact into a directory.
+
+        The artefact is written to a temporary file and moved into place, so
+        readers never see a partially written index.
+
+        Args:
+            db_dir: Directory of the vector store.
+
+        Returns:
+            str: The checksum of the written artefact's data.
+        """
+        sections = {
+            **self.storage.sections(),
+            **self.backend.sections(),
+            "code_offsets": self.codes.offsets,
+            "code_data": self.codes.data,
+            "title_offsets": self.titles.offsets,
+            "title_data": self.titles.data,
+        }
+        if self.storage.lossy and self.full_vectors is not None:
+            sections["full_vectors"] = self.full_vectors
+        layout: dict[str, dict[str, Any]] = {}
+        offset = 0
+        digest = hashlib.sha256()
+        for name, array in sections.items():
+            padding = _padding(offset)
+            digest.update(bytes(padding))
+            offset += padding
+            layout[name] = {
+                "offset": offset,
+                "dtype": array.dtype.str,
+                "shape": list(array.shape),
+            }
+            digest.update(np.ascontiguousarray(array).tobytes())
+            offset += array.nbytes
+
+        self.checksum = digest.hexdigest()
+        header = json.dumps(
+            {
+                "format_version": SEARCH_INDEX_FORMAT_VERSION,
+                "created_at": datetime.now(UTC).isoformat(),
+                "embedding_model_name": self.embedding_model_name,
+                "k_matches": self.k_matches,
+                "index_source_file": self.index_source_file,
+                "size": len(self),
+                "dimension": self.storage.dimension,
+                "storage": {"mode": self.storage.mode, **self.storage.params()},
+                "backend": {"name": self.backend.name, **self.backend.params()},
+                "sections": layout,
+                "checksum": {"algorithm": "sha256", "value": self.checksum},
+            }
+        ).encode("utf-8")
+
+        os.makedirs(db_dir, exist_ok=True)
+        self.backend.save_files(db_dir)
+        path = os.path.join(db_dir, SEARCH_INDEX_FILE)
+        with open(f"{path}.tmp", "wb") as f:
+            f.write(
+                _PREAMBLE.pack(
+                    SEARCH_INDEX_MAGIC, SEARCH_INDEX_FORMAT_VERSION, len(header)
+                )
+            )
+            f.write(header)
+            f.write(bytes(_padding(_PREAMBLE.size + len(header))))
+            written = 0
+            for name, array in sections.items():
+                f.write(bytes(layout[name]["offset"] - written))
+                f.write(np.ascontiguousarray(array).tobytes())
+                written = layout[name]["offset"] + array.nbytes
+        os.replace(f"{path}.tmp", path)
+        return self.checksum
+
+    @classmethod
+    def load(cls, db_dir: str, verify_checksum: bool = True) -> "SearchIndex":
+        """Memory-map a search index artefact from a directory.
+
+        Args:
+            db_dir: Directory of the vector store.
+            verify_checksum: Whether to verify the data against its checksum.
+
+        Returns:
+            SearchIndex: The loaded search index.
+
+        Raises:
+            SearchIndexFormatError: If the artefact is not a supported search
+                index or fails its checksum.
+        """
+        path = os.path.join(db_dir, SEARCH_INDEX_FILE)
+        header = read_header(path)
+        data_start = _PREAMBLE.size + header["header_length"]
+        data_start += _padding(data_start)
+        data = np.memmap(path, dtype=np.uint8, mode="r", offset=data_start)
+
+        checksum = header["checksum"]["value"]
+        if verify_checksum and _sha256(data) != checksum:
+            raise SearchIndexFormatError(f"Search index checksum mismatch: {path}")
+
+        sections = {
+            name: _section(data, layout) for name, layout in header["sections"].items()
+        }
+        storage_params = header.get("storage", {"mode": "float32"})
+        storage_mode = storage_params["mode"]
+        if storage_mode not in STORAGE_MODES:
+            raise SearchIndexFormatError(
+                f"Unsupported search index storage '{storage_mode}': {path}"
+            )
+        backend_params = header.get("backend", {"name": FlatBackend.name})
+        backend_name = backend_params["name"]
+        if backend_name not in SEARCH_BACKENDS:
+            raise SearchIndexFormatError(
+                f"Unsupported search index backend '{backend_name}': {path}"
+            )
+        return cls(
+            STORAGE_MODES[storage_mode].from_sections(sections, storage_params),
+            StringColumn(sections["code_data"], sections["code_offsets"]),
+            StringColumn(sections["title_data"], sections["title_offsets"]),
+            embedding_model_name=header["embedding_model_name"],
+            k_matches=header["k_matches"],
+            index_source_file=header["index_source_file"],
+            checksum=checksum,
+            full_vectors=sections.get("full_vectors"),
+            backend=SEARCH_BACKENDS[backend_name].from_artefact(
+                sections, backend_params, db_dir
+            ),
+        )
+
+
+def read_header(path: str) -> dict[str, Any]:
+    """Read the self-describing header of a search index artefact.
+
+    Args:
+        path: Path to the artefact.
+
+    Returns:
+        dict: The artefact header, including its header_length.
+
+    Raises:
+        SearchIndexFormatError: If the file is not a supported search index.
+    """
+    with open(path, "rb") as f:
+        preamble = f.read(_PREAMBLE.size)
+        if len(preamble) < _PREAMBLE.size:
+            raise SearchIndexFormatError(f"Search index is truncated: {path}")
+        magic, version, header_length = _PREAMBLE.unpack(preamble)
+        if magic != SEARCH_INDEX_MAGIC:
+            raise SearchIndexFormatError(f"Not a search index artefact: {path}")
+        if version not in SUPPORTED_FORMAT_VERSIONS:
+            raise SearchIndexFormatError(
+                f"Unsupported search index format version {version}: {path}"
+            )
+        header = json.loads(f.read(header_length).decode("utf-8"))
+    header["header_length"] = header_length
+    return header
+
+
+def _as_column(values: Sequence[str] | StringColumn) -> StringColumn:
+    """Store a sequence of strings as a string column."""
+    if isinstance(values, StringColumn):
+        return values
+    return StringColumn.from_strings(values)
+
+
+def _padding(offset: int) -> int:
+    """Number of bytes needed to align an offset."""
+    return -offset % _ALIGNMENT
+
+
+def _section(data: np.ndarray, layout: dict[str, Any]) -> np.ndarray:
+    """View one section of the artefact's data without copying it."""
+    dtype = np.dtype(layout["dtype"])
+    count = int(np.prod(layout["shape"]))
+    start = layout["offset"]
+    return (
+        data[start : start + count * dtype.itemsize]
+        .view(dtype)
+        .reshape(layout["shape"])
+    )
+
+
+def _sha256(data: np.ndarray) -> str:
+    """Compute the sha256 digest of an array's bytes in chunks."""
+    digest = hashlib.sha256()
+    for start in range(0, len(data), _CHECKSUM_CHUNK_SIZE):
+        digest.update(data[start : start + _CHECKSUM_CHUNK_SIZE])
+    return digest.hexdigest()
@@ -3,15 +3,35 @@
 This module contains utility functions to manage the vector store interface.
 """
 
+import asyncio
 import os
-from threading import Event
+import time
+from collections.abc import Awaitable, Callable, Sequence
+from datetime import UTC, datetime
+from threading import Event, Lock, Thread
+from typing import Any, cast
 
+import numpy as np
 from industrial_classification_utils.embed import (
     EmbeddingHandler,
     SearchIndexResponse,
 )
 from survey_assist_utils.logging import get_logger
 
+from sic_classification_vector_store.utils.cache import (
+    EmbeddingCache,
+    ResultCache,
+    normalise_query,
+)
+from sic_classification_vector_store.utils.common import safe_bool, safe_int
+from sic_classification_vector_store.utils.encoder import SentenceEncoder
+from sic_classification_vector_store.utils.metrics import LOAD_SECONDS, timed_stage
+from sic_classification_vector_store.utils.search_executor import SearchExecutor
+from sic_classification_vector_store.utils.search_index import (
+    SEARCH_INDEX_FILE,
+    SearchIndex,
+)
+
 logger = get_logger(__name__, level="DEBUG")
 
 # Shared variables and events
@@ -21,6 +41,133 @@ vector_store_ready_event = Event()
 VECTOR_STORE_DIR = os.getenv(
     "VECTOR_STORE_DIR", "src/sic_classification_vector_store/data/vector_store"
 )
+SEARCH_MAX_WORKERS = safe_int(
+    os.getenv("SEARCH_MAX_WORKERS"), default=min(4, os.cpu_count() or 1)
+)
+SEARCH_QUEUE_SIZE = safe_int(os.getenv("SEARCH_QUEUE_SIZE"), default=64)
+SEARCH_INDEX_VERIFY_CHECKSUM = safe_bool(
+    os.getenv("SEARCH_INDEX_VERIFY_CHECKSUM"), default=True
+)
+RESULT_CACHE_SIZE = safe_int(os.getenv("RESULT_CACHE_SIZE"), default=10000)
+RESULT_CACHE_TTL_SECONDS = safe_int(os.getenv("RESULT_CACHE_TTL_SECONDS"), default=0)
+EMBEDDING_CACHE_SIZE = safe_int(os.getenv("EMBEDDING_CACHE_SIZE"), default=20000)
+EMBEDDING_CACHE_DTYPE = os.getenv("EMBEDDING_CACHE_DTYPE", "float32")
+INDEX_WATCH_INTERVAL_SECONDS = safe_int(
+    os.getenv("INDEX_WATCH_INTERVAL_SECONDS"), default=0
+)
+SEARCH_RERANK_FACTOR = safe_int(os.getenv("SEARCH_RERANK_FACTOR"), default=4)
+MICRO_BATCH_ENABLED = safe_bool(os.getenv("MICRO_BATCH_ENABLED"), default=False)
+MICRO_BATCH_MAX_SIZE = safe_int(os.getenv("MICRO_BATCH_MAX_SIZE"), default=32)
+MICRO_BATCH_WAIT_MS = safe_int(os.getenv("MICRO_BATCH_WAIT_MS"), default=5)
+
+# A query is the (industry_descr, job_title, job_description) triple
+SearchQuery = tuple[str, str, str]
+
+
+class MicroBatcher:
+    """Coalesce concurrent single searches into batched searches.
+
+    Queries arriving within a short window, or until the batch is full, are
+    searched together and each caller receives its own results. All state is
+    owned by the event loop, so no locking is needed.
+    """
+
+    def __init__(
+        self,
+        search_batch: Callable[
+            [list[SearchQuery]], Awaitable[list[SearchIndexResponse]]
+        ],
+        max_batch_size: int = MICRO_BATCH_MAX_SIZE,
+        max_wait_ms: int = MICRO_BATCH_WAIT_MS,
+    ):
+        """Initialise the micro-batcher.
+
+        Args:
+            search_batch: Coroutine function that searches a batch of queries.
+            max_batch_size: Number of queries that triggers an immediate flush.
+            max_wait_ms: Longest time a query waits for others to join its batch.
+        """
+        self.search_batch = search_batch
+        self.max_batch_size = max(max_batch_size, 1)
+        self.max_wait = max(max_wait_ms, 0) / 1000
+        self._pending: list[tuple[SearchQuery, asyncio.Future, float]] = []
+        self._timer: asyncio.TimerHandle | None = None
+        self._tasks: set[asyncio.Task] = set()
+        self.batches = 0
+        self.queries = 0
+        self.max_batch_size_seen = 0
+        self.total_wait = 0.0
+        self.max_wait_seen = 0.0
+
+    async def search(self, query: SearchQuery) -> SearchIndexResponse:
+        """Queue a query for the next batch and await its results.
+
+        Args:
+            query: The (industry_descr, job_title, job_description) triple.
+
+        Returns:
+            The search results for the query.
+        """
+        loop = asyncio.get_running_loop()
+        future: asyncio.Future = loop.create_future()
+        self._pending.append((query, future, time.perf_counter()))
+        if len(self._pending) >= self.max_batch_size:
+            self._flush()
+        elif self._timer is None:
+            self._timer = loop.call_later(self.max_wait, self._flush)
+        return await future
+
+    def stats(self) -> dict[str, float]:
+        """Return the batch size and queue wait metrics.
+
+        Returns:
+            dict: Batch counts, batch sizes and queue wait times in milliseconds.
+        """
+        return {
+            "batches": self.batches,
+            "queries": self.queries,
+            "mean_batch_size": self.queries / self.batches if self.batches else 0.0,
+            "max_batch_size": self.max_batch_size_seen,
+            "mean_queue_wait_ms": (
+                1000 * self.total_wait / self.queries if self.queries else 0.0
+            ),
+            "max_queue_wait_ms": 1000 * self.max_wait_seen,
+        }
+
+    def _flush(self) -> None:
+        """Dispatch the pending queries as one batch."""
+        if self._timer is not None:
+            self._timer.cancel()
+            self._timer = None
+        batch, self._pending = self._pending, []
+        if not batch:
+            return
+        now = time.perf_counter()
+        waits = [now - queued_at for _, _, queued_at in batch]
+        self.batches += 1
+        self.queries += len(batch)
+        self.max_batch_size_seen = max(self.max_batch_size_seen, len(batch))
+        self.total_wait += sum(waits)
+        self.max_wait_seen = max(self.max_wait_seen, *waits)
+        task = asyncio.get_running_loop().create_task(self._run(batch))
+        self._tasks.add(task)
+        task.add_done_callback(self._tasks.discard)
+
+    async def _run(
+        self, batch: list[tuple[SearchQuery, asyncio.Future, float]]
+    ) -> None:
+        """Search a batch and fan the results back out to the callers."""
+        logger.debug(f"Dispatching micro-batch - size: {len(batch)}")
+        try:
+            results = await self.search_batch([query for query, _, _ in batch])
+        except Exception as e:  # pylint: disable=broad-exception-caught
+            for _, future, _ in batch:
+                if not future.done():
+                    future.set_exception(e)
+            return
+        for (_, future, _), result in zip(batch, results, strict=True):
+            if not future.done():
+                future.set_result(result)
 
 
 class VectorStoreManager:
@@ -33,15 +180,155 @@ class VectorStoreManager:
     def __init__(self):
         """Initialise the vector store manager."""
         self.ready_event = vector_store_ready_event
-        self.embed = None
+        self.embed: EmbeddingHandler | None = None
+        self.index: SearchIndex | None = None
+        self.encoder: SentenceEncoder | None = None
+        self.cache = ResultCache(RESULT_CACHE_SIZE, RESULT_CACHE_TTL_SECONDS)
+        self.embedding_cache = EmbeddingCache(
+            EMBEDDING_CACHE_SIZE, EMBEDDING_CACHE_DTYPE
+        )
+        self.executor = SearchExecutor(SEARCH_MAX_WORKERS, SEARCH_QUEUE_SIZE)
+        self.batcher: MicroBatcher | None = (
+            MicroBatcher(self._search_uncached_async) if MICRO_BATCH_ENABLED else None
+        )
+        self.db_dir = VECTOR_STORE_DIR
         self.load_error: str | None = None
+        self.version: str | None = None
+        self.loaded_at: str | None = None
+        self.reload_error: str | None = None
+        # Guards swapping the loaded index, encoder and handler together
+        self._swap_lock = Lock()
+        self._reload_lock = Lock()
+
+    @property
+    def reloading(self) -> bool:
+        """Whether a reload is in progress."""
+        return self._reload_lock.locked()
+
+    @property
+    def loaded(self) -> bool:
+        """Whether a search index or embedding handler has been loaded."""
+        return self.index is not None or self.embed is not None
+
+    def get_embed_config(self) -> dict[str, Any]:
+        """Describe the loaded vector store.
+
+        Returns:
+            dict: The embedding status fields of the loaded index, with the
+                search index's storage and memory footprint when one is loaded.
+
+        Raises:
+            RuntimeError: If the vector store is not loaded
+        """
+        if self.index is not None:
+            return {
+                "status": "ready",
+                "embedding_model_name": self.index.embedding_model_name,
+                "db_dir": self.db_dir,
+                "index_source_file": self.index.index_source_file,
+                "k_matches": self.index.k_matches,
+                "index_size": len(self.index),
+                "search_index": {
+                    **self.index.footprint(),
+                    "rerank_factor": SEARCH_RERANK_FACTOR,
+                },
+            }
+        if self.embed is not None:
+            return self.embed.get_embed_config().model_dump()
+        raise RuntimeError("Vector store not loaded")
 
     def load(self):
-        """Load the vector store and update its status."""
+        """Load the vector store and swap it in.
+
+        A prebuilt search index artefact is memory-mapped when present.
+        Otherwise the embedding handler loads the store from db_dir. The
+        current store keeps serving until the new one is fully loaded, then
+        the two are swapped atomically. Searches already running finish on
+        the store they started with.
+        """
         self.load_error = None
         logger.info(f"Loading the vector store - db_dir: {VECTOR_STORE_DIR}")
-        self.embed = EmbeddingHandler(db_dir=VECTOR_STORE_DIR)
-        logger.info("Vector store loaded")
+        start = time.perf_counter()
+        embed, index, encoder = None, None, self.encoder
+        if SearchIndex.exists(VECTOR_STORE_DIR):
+            index = SearchIndex.load(
+                VECTOR_STORE_DIR, verify_checksum=SEARCH_INDEX_VERIFY_CHECKSUM
+            )
+            if encoder is None or encoder.model_name != index.embedding_model_name:
+                encoder = SentenceEncoder(index.embedding_model_name)
+            logger.info(
+                f"Search index loaded - size: {len(index)}, "
+                f"checksum: {index.checksum}"
+            )
+        else:
+            logger.warning(
+                "Search index not found, searches will use the embedding handler"
+            )
+            embed = EmbeddingHandler(db_dir=VECTOR_STORE_DIR)
+            encoder = None
+        with self._swap_lock:
+            encoder_changed = encoder is not self.encoder
+            self.embed, self.index, self.encoder = embed, index, encoder
+            self.db_dir = VECTOR_STORE_DIR
+            self.version = index.checksum if index is not None else None
+            self.loaded_at = datetime.now(UTC).isoformat()
+            self.cache.clear()
+            if encoder_changed:
+                self.embedding_cache.clear()
+        LOAD_SECONDS.set(value=time.perf_counter() - start)
+        logger.info(f"Vector store loaded - version: {self.version}")
+
+    def reload(self) -> bool:
+        """Load the vector store again while the current one keeps serving.
+
+        A failed reload is logged and recorded in reload_error, and the
+        current store carries on serving.
+
+        Returns:
+            bool: False if a reload was already in progress.
+        """
+        if not self._reload_lock.acquire(blocking=False):
+            return False
+        self._reload_locked()
+        return True
+
+    def start_reload(self) -> bool:
+        """Reload the vector store on a background thread.
+
+        Returns:
+            bool: False if a reload was already in progress.
+        """
+        if not self._reload_lock.acquire(blocking=False):
+            return False
+        Thread(target=self._reload_locked, daemon=True).start()
+        return True
+
+    def watch(self, interval: float, stop: Event) -> None:
+        """Reload whenever the search index artefact changes, until stopped.
+
+        Args:
+            interval: Seconds between checks of the artefact.
+            stop: Event that ends the watch when set.
+        """
+        logger.info(f"Watching the search index for changes - every {interval}s")
+        signature = _artefact_signature(VECTOR_STORE_DIR)
+        while not stop.wait(interval):
+            current = _artefact_signature(VECTOR_STORE_DIR)
+            if current != signature:
+                logger.info("Search index changed, reloading")
+                if self.reload():
+                    signature = current
+
+    def _reload_locked(self) -> None:
+        """Reload while holding the reload lock, then release it."""
+        try:
+            self.load()
+            self.reload_error = None
+        except Exception as e:  # pylint: disable=broad-exception-caught
+            self.reload_error = str(e)
+            logger.error(f"Error reloading vector store: {e}", exc_info=True)
+        finally:
+            self._reload_lock.release()
 
     def search(
         self, industry_descr: str = "", job_title: str = "", job_description: str = ""
@@ -59,19 +346,162 @@ class VectorStoreManager:
         Raises:
             RuntimeError: If the vector store is not ready
         """
+        return self.search_batch([(industry_descr, job_title, job_description)])[0]
+
+    async def search_async(
+        self, industry_descr: str = "", job_title: str = "", job_description: str = ""
+    ) -> SearchIndexResponse:
+        """Run a search on the search executor without blocking the event loop.
+
+        Cached results are returned straight away. When micro-batching is
+        enabled the query is searched together with other queries arriving
+        at the same time.
+
+        Args:
+            industry_descr: Industry description to search for
+            job_title: Job title to search for
+            job_description: Job description to search for
+
+        Returns:
+            List of search results
+
+        Raises:
+            RuntimeError: If the vector store is not ready
+            SearchQueueFullError: If the search executor is saturated
+        """
+        query = _query_fields([(industry_descr, job_title, job_description)])[0]
+        key = normalise_query(query)
+        generation = self.cache.generation
+        cached = self.cache.get(key)
+        if cached is not None:
+            return cached
+        if self.batcher is not None:
+            result = await self.batcher.search(query)
+        else:
+            result = (await self._search_uncached_async([query]))[0]
+        self.cache.put(key, result, generation)
+        return result
+
+    async def search_batch_async(
+        self, queries: Sequence[SearchQuery]
+    ) -> list[SearchIndexResponse]:
+        """Run a batch search on the search executor without blocking the event loop.
+
+        Args:
+            queries: Sequence of (industry_descr, job_title, job_description)
+                triples to search for
+
+        Returns:
+            One list of search results per query, in the order given
+
+        Raises:
+            RuntimeError: If the vector store is not ready
+            SearchQueueFullError: If the search executor is saturated
+        """
+        return await self.executor.run(self.search_batch, queries)
+
+    def search_batch(self, queries: Sequence[SearchQuery]) -> list[SearchIndexResponse]:
+        """Search the vector store for a batch of queries.
+
+        Queries with cached results are answered from the result cache. The
+        remaining query strings are encoded in one pass and matched against
+        the index with a single matrix product. Each query's results are the
+        merged matches of its three fields, closest first.
+
+        Args:
+            queries: Sequence of (industry_descr, job_title, job_description)
+                triples to search for
+
+        Returns:
+            One list of search results per query, in the order given
+
+        Raises:
+            RuntimeError: If the vector store is not ready
+        """
+        fields = _query_fields(queries)
+        keys = [normalise_query(query) for query in fields]
+        generation = self.cache.generation
+        results = [self.cache.get(key) for key in keys]
+        missing = [i for i, result in enumerate(results) if result is None]
+        if missing:
+            found = self._search_uncached([fields[i] for i in missing])
+            for i, result in zip(missing, found, strict=True):
+                results[i] = result
+                self.cache.put(keys[i], result, generation)
+        return cast(list[SearchIndexResponse], results)
+
+    async def _search_uncached_async(
+        self, queries: list[SearchQuery]
+    ) -> list[SearchIndexResponse]:
+        """Search a batch on the search executor, bypassing the result cache."""
+        return await self.executor.run(self._search_uncached, queries)
+
+    def _search_uncached(self, queries: list[SearchQuery]) -> list[SearchIndexResponse]:
+        """Search a batch of normalised query fields, bypassing the result cache."""
         if not self.ready_event.is_set():
             raise RuntimeError("Vector store is not ready")
 
-        if not self.embed:
-            raise RuntimeError("Vector store not loaded")
+        with self._swap_lock:
+            index, encoder, embed = self.index, self.encoder, self.embed
+
+        if index is not None and encoder is not None:
+            return self._search_index(index, encoder, queries)
 
-        return self.embed.search_index_multi(
-            query=[
-                industry_descr or "",
-                job_title or "",
-                job_description or "",
+        if embed is not None:
+            with timed_stage("embedding_handler"):
+                return [
+                    embed.search_index_multi(query=list(query)) for query in queries
+                ]
+
+        raise RuntimeError("Vector store not loaded")
+
+    def _search_index(
+        self, index: SearchIndex, encoder: SentenceEncoder, queries: list[SearchQuery]
+    ) -> list[SearchIndexResponse]:
+        """Encode the unique query strings and search the matrix index once."""
+        texts = list(dict.fromkeys(text for query in queries for text in query))
+        with timed_stage("encode"):
+            vectors = self.embedding_cache.encode(texts, encoder.encode)
+        with timed_stage("lookup"):
+            distances, ids = index.search(
+                vectors, index.k_matches, rerank_factor=SEARCH_RERANK_FACTOR
+            )
+        with timed_stage("results"):
+            rows = {text: row for row, text in enumerate(texts)}
+            return [
+                _merge_results(index, query, rows, distances, ids) for query in queries
             ]
-        )
+
+
+def _artefact_signature(db_dir: str) -> tuple[int, int, int] | None:
+    """Identify the current search index artefact by inode, size and mtime."""
+    try:
+        stat = os.stat(os.path.join(db_dir, SEARCH_INDEX_FILE))
+    except OSError:
+        return None
+    return stat.st_ino, stat.st_size, stat.st_mtime_ns
+
+
+def _query_fields(queries: Sequence[Sequence[str | None]]) -> list[SearchQuery]:
+    """Replace missing query fields with empty strings."""
+    return [(query[0] or "", query[1] or "", query[2] or "") for query in queries]
+
+
+def _merge_results(
+    index: SearchIndex,
+    query: SearchQuery,
+    rows: dict[str, int],
+    distances: np.ndarray,
+    ids: np.ndarray,
+) -> SearchIndexResponse:
+    """Merge the matches of each field of a query, closest first."""
+    results = [
+        index.result(row, distance)
+        for text in query
+        for row, distance in zip(ids[rows[text]], distances[rows[text]], strict=True)
+        if row >= 0
+    ]
+    return sorted(results, key=lambda result: result["distance"])
 
 
 # Create singleton instance
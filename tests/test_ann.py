@@ -0,0 +1,99 @@
+"""Unit tests for the nearest-neighbour search backends."""
+
+import numpy as np
+import pytest
+
+from sic_classification_vector_store.utils import ann
+from sic_classification_vector_store.utils.ann import (
+    FlatBackend,
+    IVFBackend,
+    build_backend,
+)
+from sic_classification_vector_store.utils.quantisation import Float32Storage
+from sic_classification_vector_store.utils.search_index import SearchIndex
+
+
+def _unit_vectors(size: int, dimension: int, seed: int = 0) -> np.ndarray:
+    """Build random L2 normalised vectors."""
+    vectors = np.random.default_rng(seed).normal(size=(size, dimension))
+    vectors /= np.linalg.norm(vectors, axis=1, keepdims=True)
+    return vectors.astype(np.float32)
+
+
+@pytest.mark.utils
+def test_flat_backend_returns_exact_top_k():
+    """The flat backend should return the exact best rows, best first."""
+    vectors = _unit_vectors(200, 16)
+    queries = _unit_vectors(5, 16, seed=1)
+    exact = queries @ vectors.T
+
+    scores, ids = FlatBackend().search(Float32Storage(vectors), queries, k=10)
+
+    np.testing.assert_array_equal(ids, np.argsort(-exact, axis=1)[:, :10])
+    np.testing.assert_allclose(scores, -np.sort(-exact, axis=1)[:, :10], rtol=1e-6)
+
+
+@pytest.mark.utils
+def test_ivf_backend_probing_every_list_is_exact():
+    """Scanning every inverted list should match the flat backend."""
+    vectors = _unit_vectors(400, 16)
+    queries = _unit_vectors(5, 16, seed=1)
+    storage = Float32Storage(vectors)
+    backend = IVFBackend.build(vectors, lists=10)
+    backend.nprobe = 10
+
+    _, ids = backend.search(storage, queries, k=10)
+
+    _, exact_ids = FlatBackend().search(storage, queries, k=10)
+    np.testing.assert_array_equal(ids, exact_ids)
+    assert backend.params() == {"lists": 10}
+    assert sorted(backend.ids.tolist()) == list(range(400))
+
+
+@pytest.mark.utils
+def test_ivf_backend_pads_when_probed_lists_are_short():
+    """Queries whose probed lists hold fewer than k rows should be padded."""
+    vectors = _unit_vectors(40, 8)
+    backend = IVFBackend.build(vectors, lists=20)
+    backend.nprobe = 1
+
+    scores, ids = backend.search(Float32Storage(vectors), vectors[:1], k=20)
+
+    assert ids[0, 0] == 0
+    assert (ids[0] == -1).any()
+    assert np.isneginf(scores[ids == -1]).all()
+
+
+@pytest.mark.utils
+def test_search_index_saves_and_loads_ivf_backend(tmp_path):
+    """The ivf structures should round trip through the artefact."""
+    vectors = _unit_vectors(100, 8)
+    codes = [f"{row:05d}" for row in range(100)]
+    SearchIndex(
+        vectors,
+        codes,
+        codes,
+        embedding_model_name="all-MiniLM-L6-v2",
+        k_matches=5,
+        backend=IVFBackend.build(vectors, lists=4),
+    ).save(str(tmp_path))
+
+    loaded = SearchIndex.load(str(tmp_path))
+    distances, ids = loaded.search(vectors[:3], k=1)
+
+    assert isinstance(loaded.backend, IVFBackend)
+    assert loaded.footprint()["backend"] == "ivf"
+    assert ids[:, 0].tolist() == [0, 1, 2]
+    np.testing.assert_allclose(distances[:, 0], 0.0, atol=1e-6)
+
+
+@pytest.mark.utils
+def test_build_backend_rejects_unknown_and_unavailable_backends(mocker):
+    """Unknown backends fail and hnsw needs hnswlib installed."""
+    vectors = _unit_vectors(10, 4)
+    mocker.patch.object(ann, "hnswlib", None)
+
+    with pytest.raises(ValueError, match="Unsupported search backend"):
+        build_backend(vectors, "annoy")
+    with pytest.raises(RuntimeError, match="hnswlib"):
+        build_backend(vectors, "hnsw")
@@ -0,0 +1,38 @@
+"""Smoke test for the offline search benchmarks."""
+
+import json
+from threading import Event
+
+import pytest
+
+from benchmarks import search
+from sic_classification_vector_store.utils.vector_store import VectorStoreManager
+
+
+@pytest.mark.utils
+def test_benchmark_writes_machine_readable_results(mocker, tmp_path):
+    """A small synthetic run should report latency, throughput and recall."""
+    manager = VectorStoreManager()
+    manager.ready_event = Event()
+    mocker.patch.object(search, "vector_store_manager", manager)
+    output = tmp_path / "results.json"
+
+    exit_code = search.main(
+        [
+            "--synthetic=200",
+            "--num-queries=20",
+            "--dimension=32",
+            "--concurrency",
+            "1",
+            "2",
+            f"--output={output}",
+        ]
+    )
+
+    results = json.loads(output.read_text())
+    assert exit_code == 0
+    assert results["config"]["index_size"] == 200  # noqa: PLR2004
+    assert results["recall_at_k"] == pytest.approx(1.0)
+    assert set(results["latency"]) == {"p50_ms", "p95_ms", "p99_ms", "mean_ms"}
+    assert [run["concurrency"] for run in results["throughput"]] == [1, 2]
+    assert results["memory"]["peak_rss_bytes"] > 0
@@ -0,0 +1,149 @@
+"""Unit tests for the search result cache."""
+
+import numpy as np
+import pytest
+
+import sic_classification_vector_store.utils.cache as cache_module
+from sic_classification_vector_store.utils.cache import (
+    EmbeddingCache,
+    ResultCache,
+    normalise_query,
+    normalise_text,
+)
+
+
+@pytest.mark.utils
+def test_normalise_text_ignores_case_whitespace_and_punctuation():
+    """Equivalent free text should produce the same cache key."""
+    assert normalise_text("  Retail-Assistant!  ") == "retail assistant"
+    assert normalise_text(None) == ""
+    assert normalise_query(["Teacher.", None, "Maths  TEACHER"]) == (
+        "teacher",
+        "",
+        "maths teacher",
+    )
+
+
+@pytest.mark.utils
+def test_result_cache_evicts_least_recently_used():
+    """The cache should stay within its size limit, evicting the oldest entry."""
+    cache = ResultCache(max_size=2)
+    cache.put("a", 1)
+    cache.put("b", 2)
+    assert cache.get("a") == 1
+
+    cache.put("c", 3)
+
+    assert cache.get("b") is None
+    assert cache.get("a") == 1
+    assert cache.get("c") == 3  # noqa: PLR2004
+    assert cache.stats() == {
+        "enabled": True,
+        "size": 2,
+        "max_size": 2,
+        "hits": 3,
+        "misses": 1,
+    }
+
+
+@pytest.mark.utils
+def test_result_cache_expires_entries_after_ttl(monkeypatch):
+    """Entries older than the time-to-live should be treated as misses."""
+    now = [100.0]
+    monkeypatch.setattr(cache_module.time, "monotonic", lambda: now[0])
+    cache = ResultCache(max_size=10, ttl_seconds=5)
+    cache.put("a", 1)
+
+    now[0] += 4
+    assert cache.get("a") == 1
+    now[0] += 2
+    assert cache.get("a") is None
+    assert len(cache) == 0
+
+
+@pytest.mark.utils
+def test_result_cache_disabled_with_zero_size():
+    """A zero sized cache should never store entries."""
+    cache = ResultCache(max_size=0)
+    cache.put("a", 1)
+
+    assert cache.get("a") is None
+    assert not cache.stats()["enabled"]
+
+
+@pytest.mark.utils
+def test_result_cache_clear():
+    """Clearing the cache should remove every entry."""
+    cache = ResultCache(max_size=10)
+    cache.put("a", 1)
+
+    cache.clear()
+
+    assert cache.get("a") is None
+
+
+def _encode_lengths(calls: list[list[str]]):
+    """Build an encoder that records its calls and embeds text by length."""
+
+    def encode(texts: list[str]) -> np.ndarray:
+        calls.append(texts)
+        return np.array([[len(text), 1.0] for text in texts], dtype=np.float32)
+
+    return encode
+
+
+@pytest.mark.utils
+def test_embedding_cache_only_encodes_unseen_texts():
+    """Previously encoded texts should be served from the cache."""
+    calls: list[list[str]] = []
+    cache = EmbeddingCache(max_size=10, dtype="float16")
+    cache.encode(["cat", "fish"], _encode_lengths(calls))
+
+    vectors = cache.encode(["fish", "dog", "fish"], _encode_lengths(calls))
+
+    assert calls == [["cat", "fish"], ["dog"]]
+    assert vectors.dtype == np.float32
+    np.testing.assert_array_equal(vectors, [[4, 1], [3, 1], [4, 1]])
+    assert cache.stats()["hits"] == 1
+    assert cache.stats()["misses"] == 3  # noqa: PLR2004
+
+
+@pytest.mark.utils
+def test_embedding_cache_evicts_least_recently_used():
+    """The cache should reuse the slot of the least recently used text."""
+    calls: list[list[str]] = []
+    cache = EmbeddingCache(max_size=2)
+    cache.encode(["a", "bb"], _encode_lengths(calls))
+    cache.encode(["a"], _encode_lengths(calls))
+
+    cache.encode(["ccc"], _encode_lengths(calls))
+    cache.encode(["a", "bb"], _encode_lengths(calls))
+
+    assert calls == [["a", "bb"], ["ccc"], ["bb"]]
+    assert len(cache) == 2  # noqa: PLR2004
+
+
+@pytest.mark.utils
+def test_embedding_cache_disabled_with_zero_size():
+    """A zero sized cache should pass every text to the encoder."""
+    calls: list[list[str]] = []
+    cache = EmbeddingCache(max_size=0)
+
+    cache.encode(["a"], _encode_lengths(calls))
+    cache.encode(["a"], _encode_lengths(calls))
+
+    assert calls == [["a"], ["a"]]
+
+
+@pytest.mark.utils
+def test_result_cache_drops_values_from_before_a_clear():
+    """Values computed before a clear should not be stored after it."""
+    cache = ResultCache(max_size=10)
+    generation = cache.generation
+
+    cache.clear()
+    cache.put("stale", 1, generation)
+    cache.put("fresh", 2, cache.generation)
+
+    assert cache.get("stale") is None
+    assert cache.get("fresh") == 2  # noqa: PLR2004
@@ -5,7 +5,7 @@ Unit tests for endpoints and utility functions in the vector store.
 
 import pytest
 
-from sic_classification_vector_store.utils.common import safe_int
+from sic_classification_vector_store.utils.common import safe_bool, safe_int
 
 
 # ruff: noqa: PLR2004
@@ -28,3 +28,19 @@ def test_safe_int_default():
     """Test safe_int with default value."""
     assert safe_int("invalid") == 0
     assert safe_int(None) == 0
+
+
+@pytest.mark.utils
+def test_safe_bool_valid():
+    """Test safe_bool with recognised boolean strings."""
+    assert safe_bool("true") is True
+    assert safe_bool(" YES ") is True
+    assert safe_bool("0") is False
+    assert safe_bool(False, default=True) is False
+
+
+@pytest.mark.utils
+def test_safe_bool_invalid():
+    """Test safe_bool falls back to the default for unrecognised input."""
+    assert safe_bool(None) is False
+    assert safe_bool("maybe", default=True) is True
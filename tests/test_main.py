@@ -23,6 +23,8 @@ import pytest
 from fastapi.testclient import TestClient
 from survey_assist_utils.logging import get_logger
 
+import sic_classification_vector_store.api.main as main_module
+import sic_classification_vector_store.api.routes.v1.search_index as search_index_module
 import sic_classification_vector_store.utils.vector_store as vs_module
 from sic_classification_vector_store.api.main import (
     app,  # Adjust the import based on your project structure
@@ -30,6 +32,7 @@ from sic_classification_vector_store.api.main import (
 from sic_classification_vector_store.utils.build_vector_store_index import (
     build_vector_store_index,
 )
+from sic_classification_vector_store.utils.search_executor import SearchQueueFullError
 
 logger = get_logger(__name__)
 client = TestClient(app)  # Create a test client for your FastAPI app
@@ -43,6 +46,13 @@ STATUS_RESPONSE_KEYS = {
     "index_source_file",
     "k_matches",
     "index_size",
+    "result_cache",
+    "embedding_cache",
+    "search_index",
+    "version",
+    "loaded_at",
+    "reloading",
+    "reload_error",
 }
 
 
@@ -78,6 +88,89 @@ def test_get_status_loading():
     assert set(data) == STATUS_RESPONSE_KEYS
 
 
+@pytest.mark.api
+def test_search_index_batch_loading():
+    """Test the `/v1/sic-vector-store/search-index/batch` endpoint while loading.
+
+    The batch endpoint should report the vector store as unavailable until it
+    has finished loading.
+    """
+    response = client.post(
+        "/v1/sic-vector-store/search-index/batch",
+        json=[
+            {
+                "industry_descr": "school teacher",
+                "job_title": "teach maths",
+                "job_description": "mainstream education",
+            }
+        ],
+    )
+
+    assert response.status_code == HTTPStatus.SERVICE_UNAVAILABLE
+
+
+@pytest.mark.api
+def test_search_index_batch_too_large(monkeypatch):
+    """Test the batch endpoint rejects batches above the configured maximum."""
+    monkeypatch.setattr(search_index_module, "SEARCH_BATCH_MAX_SIZE", 1)
+    item = {"industry_descr": "", "job_title": "teacher", "job_description": ""}
+
+    response = client.post("/v1/sic-vector-store/search-index/batch", json=[item, item])
+
+    assert response.status_code == HTTPStatus.REQUEST_ENTITY_TOO_LARGE
+
+
+@pytest.mark.api
+def test_search_index_saturated(monkeypatch):
+    """Test the search endpoint returns 429 when the search queue is full."""
+
+    async def _reject(**_kwargs):
+        raise SearchQueueFullError("Search queue is full, retry later")
+
+    monkeypatch.setattr(vs_module.vector_store_manager, "search_async", _reject)
+
+    response = client.post(
+        "/v1/sic-vector-store/search-index",
+        json={"industry_descr": "", "job_title": "teacher", "job_description": ""},
+    )
+
+    assert response.status_code == HTTPStatus.TOO_MANY_REQUESTS
+    assert response.headers["Retry-After"] == "1"
+
+
+@pytest.mark.api
+def test_search_index_reports_metrics_and_server_timing(monkeypatch):
+    """Test searches are timed per stage in `/metrics` and Server-Timing."""
+
+    async def _search(**_kwargs):
+        return [{"distance": 0.1, "title": "Cat", "code": "01110"}]
+
+    monkeypatch.setattr(vs_module.vector_store_manager, "search_async", _search)
+    monkeypatch.setattr(main_module, "SERVER_TIMING_ENABLED", True)
+
+    response = client.post(
+        "/v1/sic-vector-store/search-index",
+        json={"industry_descr": "", "job_title": "teacher", "job_description": ""},
+    )
+    metrics = client.get("/metrics")
+
+    assert response.status_code == HTTPStatus.OK
+    stages = [
+        entry.split(";")[0] for entry in response.headers["Server-Timing"].split(", ")
+    ]
+    assert stages == ["parse", "serialise", "total"]
+    assert metrics.status_code == HTTPStatus.OK
+    assert metrics.headers["content-type"].startswith("text/plain")
+    assert (
+        'sic_vector_store_request_seconds_count{route="/v1/sic-vector-store/search-index",status="200"}'
+        in metrics.text
+    )
+    assert (
+        'sic_vector_store_search_stage_seconds_count{stage="serialise"}' in metrics.text
+    )
+    assert 'sic_vector_store_cache_hits_total{cache="result"}' in metrics.text
+
+
 @pytest.mark.api
 def test_status_ready(monkeypatch, tmp_path):
     """Test the `/v1/sic-vector-store/status` endpoint until the status is ready.
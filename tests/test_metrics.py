@@ -0,0 +1,75 @@
+"""Unit tests for the Prometheus-style metrics."""
+
+import asyncio
+
+import pytest
+
+from sic_classification_vector_store.utils.metrics import (
+    Counter,
+    Gauge,
+    Histogram,
+    MetricsRegistry,
+    record_stage,
+    server_timing,
+    stage_timings,
+)
+from sic_classification_vector_store.utils.search_executor import SearchExecutor
+
+
+@pytest.mark.utils
+def test_histogram_renders_cumulative_buckets():
+    """Histogram buckets should be cumulative and end with +Inf."""
+    histogram = Histogram("latency_seconds", "Latency.", ("stage",), buckets=(0.1, 1))
+    histogram.observe(0.05, "encode")
+    histogram.observe(0.5, "encode")
+    histogram.observe(5, "encode")
+
+    assert histogram.render() == [
+        "# HELP latency_seconds Latency.",
+        "# TYPE latency_seconds histogram",
+        'latency_seconds_bucket{stage="encode",le="0.1"} 1',
+        'latency_seconds_bucket{stage="encode",le="1.0"} 2',
+        'latency_seconds_bucket{stage="encode",le="+Inf"} 3',
+        'latency_seconds_sum{stage="encode"} 5.55',
+        'latency_seconds_count{stage="encode"} 3',
+    ]
+
+
+@pytest.mark.utils
+def test_registry_renders_counters_and_gauges():
+    """Counters and gauges should render one sample per label set."""
+    registry = MetricsRegistry()
+    counter = registry.register(Counter("hits_total", "Hits.", ("cache",)))
+    gauge = registry.register(Gauge("in_flight", "In flight."))
+    counter.inc("result", amount=2)
+    counter.set("embedding", value=7)
+    gauge.inc()
+    gauge.inc()
+    gauge.dec()
+
+    assert registry.render().splitlines()[2:] == [
+        'hits_total{cache="result"} 2.0',
+        'hits_total{cache="embedding"} 7.0',
+        "# HELP in_flight In flight.",
+        "# TYPE in_flight gauge",
+        "in_flight 1.0",
+    ]
+
+
+@pytest.mark.utils
+def test_stage_timings_reach_the_caller_from_the_search_executor():
+    """Stages recorded on a search thread should be added to the caller's timings."""
+    executor = SearchExecutor(max_workers=1, queue_size=1)
+
+    async def search() -> dict[str, float]:
+        timings: dict[str, float] = {}
+        stage_timings.set(timings)
+        await executor.run(record_stage, "encode", 0.002)
+        return timings
+
+    timings = asyncio.run(search())
+    executor.shutdown()
+
+    assert set(timings) == {"queue", "encode"}
+    assert timings["encode"] == pytest.approx(0.002)
+    assert server_timing({"encode": 0.002}) == "encode;dur=2.000"
@@ -0,0 +1,84 @@
+"""Unit tests for the vector storage precisions."""
+
+import numpy as np
+import pytest
+
+from sic_classification_vector_store.utils.quantisation import (
+    STORAGE_MODES,
+    ProductQuantStorage,
+    quantise,
+)
+
+
+def _unit_vectors(size: int, dimension: int, seed: int = 0) -> np.ndarray:
+    """Build random L2 normalised vectors."""
+    vectors = np.random.default_rng(seed).normal(size=(size, dimension))
+    vectors /= np.linalg.norm(vectors, axis=1, keepdims=True)
+    return vectors.astype(np.float32)
+
+
+def _recall(approximate: np.ndarray, exact: np.ndarray, k: int) -> float:
+    """Fraction of the exact top k found in the approximate top k."""
+    top_approximate = np.argsort(-approximate, axis=1)[:, :k]
+    top_exact = np.argsort(-exact, axis=1)[:, :k]
+    found = [
+        len(set(a) & set(e)) for a, e in zip(top_approximate, top_exact, strict=True)
+    ]
+    return sum(found) / top_exact.size
+
+
+@pytest.mark.utils
+@pytest.mark.parametrize(
+    ("mode", "min_recall"), [("float32", 1.0), ("float16", 0.99), ("int8", 0.9)]
+)
+def test_storage_scores_approximate_exact_scores(mode, min_recall):
+    """Compact storages should find nearly the same top matches as float32."""
+    vectors = _unit_vectors(500, 32)
+    queries = _unit_vectors(20, 32, seed=1)
+    exact = queries @ vectors.T
+
+    storage = quantise(vectors, mode)
+
+    assert storage.mode == mode
+    assert len(storage) == len(vectors)
+    assert _recall(storage.scores(queries), exact, k=10) >= min_recall
+
+
+@pytest.mark.utils
+def test_pq_storage_is_compact_and_scores_row_subsets():
+    """PQ should store one byte per sub-vector and score chosen rows."""
+    vectors = _unit_vectors(300, 16)
+    queries = _unit_vectors(4, 16, seed=1)
+
+    storage = quantise(vectors, "pq", pq_subvectors=4)
+    rows = np.array([5, 10, 200])
+
+    assert storage.codes.shape == (300, 4)
+    assert storage.params() == {"subvectors": 4}
+    assert storage.nbytes < vectors.nbytes
+    np.testing.assert_allclose(
+        storage.scores(queries, rows), storage.scores(queries)[:, rows], rtol=1e-5
+    )
+
+
+@pytest.mark.utils
+@pytest.mark.parametrize("mode", sorted(STORAGE_MODES))
+def test_storage_round_trips_through_sections(mode):
+    """Each storage should rebuild from the sections it writes."""
+    vectors = _unit_vectors(300, 16)
+    storage = quantise(vectors, mode)
+
+    rebuilt = STORAGE_MODES[mode].from_sections(storage.sections(), storage.params())
+
+    np.testing.assert_array_equal(rebuilt.scores(vectors), storage.scores(vectors))
+
+
+@pytest.mark.utils
+def test_quantise_rejects_invalid_settings():
+    """Unknown modes and sub-vectors that do not divide the dimension fail."""
+    vectors = _unit_vectors(10, 6)
+
+    with pytest.raises(ValueError, match="Unsupported vector storage"):
+        quantise(vectors, "float8")
+    with pytest.raises(ValueError, match="must divide"):
+        ProductQuantStorage.quantise(vectors, subvectors=4)
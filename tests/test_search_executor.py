@@ -0,0 +1,39 @@
+"""Unit tests for the bounded search executor."""
+
+from threading import Event
+
+import pytest
+
+from sic_classification_vector_store.utils.search_executor import (
+    SearchExecutor,
+    SearchQueueFullError,
+)
+
+
+@pytest.mark.utils
+@pytest.mark.asyncio
+async def test_search_executor_runs_call_off_the_event_loop():
+    """Awaiting run should return the result of the submitted call."""
+    executor = SearchExecutor(max_workers=1, queue_size=0)
+
+    assert await executor.run(lambda a, b: a + b, 1, b=2) == 3  # noqa: PLR2004
+
+    executor.shutdown()
+
+
+@pytest.mark.utils
+def test_search_executor_rejects_work_when_saturated():
+    """Submissions beyond workers plus queue size should be rejected."""
+    executor = SearchExecutor(max_workers=1, queue_size=1)
+    release = Event()
+
+    running = executor.submit(release.wait)
+    queued = executor.submit(release.wait)
+    with pytest.raises(SearchQueueFullError):
+        executor.submit(release.wait)
+
+    release.set()
+    running.result(timeout=5)
+    queued.result(timeout=5)
+    assert executor.submit(lambda: "accepted").result(timeout=5) == "accepted"
+    executor.shutdown()
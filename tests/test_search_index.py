@@ -0,0 +1,160 @@
+"""Unit tests for the matrix search index."""
+
+import numpy as np
+import pytest
+
+from sic_classification_vector_store.utils.quantisation import Int8Storage
+from sic_classification_vector_store.utils.search_index import (
+    SEARCH_INDEX_FILE,
+    SEARCH_INDEX_FORMAT_VERSION,
+    SearchIndex,
+    SearchIndexFormatError,
+    read_header,
+)
+
+
+def _make_search_index() -> SearchIndex:
+    """Build a small search index with orthogonal unit vectors."""
+    return SearchIndex(
+        np.eye(3, dtype=np.float32),
+        ["01110", "02100", "03110"],
+        ["Cat", "Dog", "Fish"],
+        embedding_model_name="all-MiniLM-L6-v2",
+        k_matches=2,
+    )
+
+
+@pytest.mark.utils
+def test_search_index_returns_closest_matches_first():
+    """Each query row should return its k nearest rows ordered by distance."""
+    search_index = _make_search_index()
+    queries = np.array([[0.0, 0.6, 0.8], [1.0, 0.0, 0.0]], dtype=np.float32)
+
+    distances, ids = search_index.search(queries, k=2)
+
+    assert ids.tolist() == [[2, 1], [0, 1]]
+    np.testing.assert_allclose(distances, [[0.2, 0.4], [0.0, 1.0]], atol=1e-6)
+
+
+@pytest.mark.utils
+def test_search_index_caps_k_at_index_size():
+    """Asking for more matches than entries should return every entry."""
+    search_index = _make_search_index()
+
+    _, ids = search_index.search(np.eye(3, dtype=np.float32)[:1], k=10)
+
+    assert ids.shape == (1, 3)
+
+
+@pytest.mark.utils
+def test_search_index_result_derives_code_levels():
+    """Results should carry the four and two digit codes of the match."""
+    result = _make_search_index().result(0, 0.25)
+
+    assert result == {
+        "distance": 0.25,
+        "title": "Cat",
+        "code": "01110",
+        "four_digit_code": "0111",
+        "two_digit_code": "01",
+    }
+
+
+@pytest.mark.utils
+def test_search_index_save_and_load_round_trip(tmp_path):
+    """A saved search index should load back with the same content."""
+    search_index = _make_search_index()
+    assert not SearchIndex.exists(str(tmp_path))
+
+    checksum = search_index.save(str(tmp_path))
+    loaded = SearchIndex.load(str(tmp_path))
+
+    assert SearchIndex.exists(str(tmp_path))
+    assert isinstance(loaded.full_vectors, np.memmap)
+    np.testing.assert_array_equal(loaded.full_vectors, search_index.full_vectors)
+    assert loaded.codes.tolist() == ["01110", "02100", "03110"]
+    assert loaded.titles.tolist() == ["Cat", "Dog", "Fish"]
+    assert loaded.embedding_model_name == "all-MiniLM-L6-v2"
+    assert loaded.k_matches == search_index.k_matches
+    assert loaded.checksum == checksum
+
+
+@pytest.mark.utils
+def test_search_index_artefact_is_self_describing(tmp_path):
+    """The artefact header should describe the index and its sections."""
+    _make_search_index().save(str(tmp_path))
+
+    header = read_header(str(tmp_path / SEARCH_INDEX_FILE))
+
+    assert header["format_version"] == SEARCH_INDEX_FORMAT_VERSION
+    assert header["storage"] == {"mode": "float32"}
+    assert header["embedding_model_name"] == "all-MiniLM-L6-v2"
+    assert header["size"] == 3  # noqa: PLR2004
+    assert header["dimension"] == 3  # noqa: PLR2004
+    assert header["sections"]["vectors"]["shape"] == [3, 3]
+    assert header["checksum"]["algorithm"] == "sha256"
+
+
+@pytest.mark.utils
+def test_search_index_load_rejects_corrupt_artefact(tmp_path):
+    """A change to the artefact's data should fail the checksum."""
+    _make_search_index().save(str(tmp_path))
+    path = tmp_path / SEARCH_INDEX_FILE
+    content = bytearray(path.read_bytes())
+    content[-1] ^= 0xFF
+    path.write_bytes(bytes(content))
+
+    with pytest.raises(SearchIndexFormatError, match="checksum"):
+        SearchIndex.load(str(tmp_path))
+    unverified = SearchIndex.load(str(tmp_path), verify_checksum=False)
+    assert len(unverified) == len(_make_search_index())
+
+
+@pytest.mark.utils
+def test_search_index_load_rejects_other_files(tmp_path):
+    """Files without the search index magic bytes should be rejected."""
+    (tmp_path / SEARCH_INDEX_FILE).write_bytes(b"not a search index artefact")
+
+    with pytest.raises(SearchIndexFormatError, match="Not a search index"):
+        SearchIndex.load(str(tmp_path))
+
+
+@pytest.mark.utils
+def test_search_index_rejects_mismatched_metadata():
+    """Metadata columns must line up with the vector rows."""
+    with pytest.raises(ValueError, match="does not match"):
+        SearchIndex(
+            np.eye(2, dtype=np.float32),
+            ["01110"],
+            ["Cat"],
+            embedding_model_name="all-MiniLM-L6-v2",
+            k_matches=1,
+        )
+
+
+@pytest.mark.utils
+def test_search_index_reranks_lossy_storage_at_full_precision(tmp_path):
+    """Re-ranking should restore exact distances for a quantised index."""
+    rng = np.random.default_rng(0)
+    vectors = rng.normal(size=(50, 8)).astype(np.float32)
+    vectors /= np.linalg.norm(vectors, axis=1, keepdims=True)
+    codes = [f"{row:05d}" for row in range(50)]
+    search_index = SearchIndex(
+        Int8Storage.quantise(vectors),
+        codes,
+        codes,
+        embedding_model_name="all-MiniLM-L6-v2",
+        k_matches=5,
+        full_vectors=vectors,
+    )
+    search_index.save(str(tmp_path))
+    loaded = SearchIndex.load(str(tmp_path))
+    exact = np.sort(1.0 - vectors[:3] @ vectors.T, axis=1)[:, :5]
+
+    distances, _ = loaded.search(vectors[:3], k=5, rerank_factor=4)
+    approximate, _ = loaded.search(vectors[:3], k=5)
+
+    assert loaded.storage.mode == "int8"
+    assert loaded.footprint()["rerank"]
+    np.testing.assert_allclose(distances, exact, atol=1e-5)
+    assert not np.allclose(approximate, exact, atol=1e-5)
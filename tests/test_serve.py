@@ -0,0 +1,19 @@
+"""Unit tests for the pre-fork server helpers."""
+
+import pytest
+
+from sic_classification_vector_store.api.serve import threads_per_worker
+
+
+@pytest.mark.api
+def test_threads_per_worker_shares_cpus_between_workers():
+    """Each worker should get an equal share of the CPUs."""
+    assert threads_per_worker(workers=4, cpus=8) == 2  # noqa: PLR2004
+    assert threads_per_worker(workers=3, cpus=8) == 2  # noqa: PLR2004
+
+
+@pytest.mark.api
+def test_threads_per_worker_is_at_least_one():
+    """Workers should always get at least one inference thread."""
+    assert threads_per_worker(workers=8, cpus=2) == 1
+    assert threads_per_worker(workers=0, cpus=2) == 2  # noqa: PLR2004
@@ -88,3 +88,6 @@ async def test_get_status_returns_status_response() -> None:
     assert result.db_dir == "test_vector_store"
     assert result.k_matches == expected_matches
     assert result.index_size == expected_index_size
+    assert result.result_cache.enabled == (vector_store_manager.cache.max_size > 0)
+    assert result.result_cache.hits == 0
+    assert result.embedding_cache.misses == 0
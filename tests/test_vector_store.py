@@ -3,11 +3,53 @@
 Unit tests for endpoints and utility functions in the vector store.
 """
 
+import asyncio
+from threading import Event, Thread
+
+import numpy as np
 import pytest
 from industrial_classification_utils.models.config_model import EmbeddingConfig
 
 import sic_classification_vector_store.utils.vector_store as vs_module
-from sic_classification_vector_store.utils.vector_store import VectorStoreManager
+from sic_classification_vector_store.utils.cache import EmbeddingCache, ResultCache
+from sic_classification_vector_store.utils.search_index import SearchIndex
+from sic_classification_vector_store.utils.vector_store import (
+    MicroBatcher,
+    VectorStoreManager,
+)
+
+
+class FakeEncoder:
+    """Encoder that maps known texts to fixed unit vectors."""
+
+    def __init__(self):
+        """Initialise the fake encoder."""
+        self.calls: list[list[str]] = []
+
+    def encode(self, texts: list[str]) -> np.ndarray:
+        """Record the call and return one basis vector per text."""
+        self.calls.append(texts)
+        vectors = {"cat": [1.0, 0.0], "dog": [0.0, 1.0], "": [0.6, 0.8]}
+        return np.array([vectors[text] for text in texts], dtype=np.float32)
+
+
+def _make_ready_manager(mocker) -> VectorStoreManager:
+    """Build a ready manager backed by a two entry search index."""
+    manager = VectorStoreManager()
+    manager.ready_event = Event()
+    manager.ready_event.set()
+    manager.embed = mocker.Mock()
+    manager.index = SearchIndex(
+        np.eye(2, dtype=np.float32),
+        ["01110", "02100"],
+        ["Cat", "Dog"],
+        embedding_model_name="mocked",
+        k_matches=1,
+    )
+    manager.encoder = FakeEncoder()
+    manager.cache = ResultCache(max_size=10)
+    manager.embedding_cache = EmbeddingCache(max_size=10)
+    return manager
 
 
 @pytest.mark.utils
@@ -35,3 +77,292 @@ def test_vector_store_manager_load(mocker, monkeypatch, tmp_path):
     mock_embed_instance.get_embed_config.assert_not_called()
     assert manager.embed == mock_embed_instance
     assert manager.embed.get_embed_config().db_dir == str(tmp_path)
+
+
+@pytest.mark.utils
+def test_vector_store_manager_load_maps_search_index(mocker, monkeypatch, tmp_path):
+    """With a search index artefact present the embedding handler is not used."""
+    monkeypatch.setattr(vs_module, "VECTOR_STORE_DIR", str(tmp_path))
+    SearchIndex(
+        np.eye(2, dtype=np.float32),
+        ["01110", "02100"],
+        ["Cat", "Dog"],
+        embedding_model_name="all-MiniLM-L6-v2",
+        k_matches=5,
+        index_source_file="example.csv",
+    ).save(str(tmp_path))
+    mock_embed_handler = mocker.patch(
+        "sic_classification_vector_store.utils.vector_store.EmbeddingHandler"
+    )
+    mock_encoder = mocker.patch(
+        "sic_classification_vector_store.utils.vector_store.SentenceEncoder"
+    )
+
+    manager = VectorStoreManager()
+    manager.load()
+
+    mock_embed_handler.assert_not_called()
+    mock_encoder.assert_called_once_with("all-MiniLM-L6-v2")
+    assert manager.embed is None
+    assert isinstance(manager.index.full_vectors, np.memmap)
+    config = manager.get_embed_config()
+    assert config.pop("search_index")["storage"] == "float32"
+    assert config == {
+        "status": "ready",
+        "embedding_model_name": "all-MiniLM-L6-v2",
+        "db_dir": str(tmp_path),
+        "index_source_file": "example.csv",
+        "k_matches": 5,
+        "index_size": 2,
+    }
+
+
+@pytest.mark.utils
+def test_search_batch_encodes_unique_texts_once(mocker):
+    """A batch should be encoded in one call with duplicate strings removed."""
+    manager = _make_ready_manager(mocker)
+
+    results = manager.search_batch([("cat", "", "dog"), ("dog", "", "")])
+
+    assert manager.encoder.calls == [["cat", "", "dog"]]
+    assert [r["code"] for r in results[0]] == ["01110", "02100", "02100"]
+    assert [r["code"] for r in results[1]] == ["02100", "02100", "02100"]
+    assert results[0][0]["distance"] == pytest.approx(0.0)
+    manager.embed.search_index_multi.assert_not_called()
+
+
+@pytest.mark.utils
+def test_search_matches_search_batch(mocker):
+    """A single search should return the same results as a batch of one."""
+    manager = _make_ready_manager(mocker)
+
+    assert (
+        manager.search("cat", "dog", "")
+        == manager.search_batch([("cat", "dog", "")])[0]
+    )
+
+
+@pytest.mark.utils
+def test_search_batch_falls_back_to_embedding_handler(mocker):
+    """Without a search index each query should use the embedding handler."""
+    manager = _make_ready_manager(mocker)
+    manager.index = None
+    manager.embed.search_index_multi.return_value = []
+
+    results = manager.search_batch([("cat", None, "dog")])
+
+    assert results == [[]]
+    manager.embed.search_index_multi.assert_called_once_with(query=["cat", "", "dog"])
+
+
+@pytest.mark.utils
+def test_search_batch_raises_when_not_ready():
+    """Searching before the vector store is ready should raise."""
+    manager = VectorStoreManager()
+    manager.ready_event = Event()
+
+    with pytest.raises(RuntimeError, match="not ready"):
+        manager.search_batch([("cat", "", "")])
+
+
+@pytest.mark.utils
+@pytest.mark.asyncio
+async def test_micro_batcher_coalesces_concurrent_searches():
+    """Concurrent searches should share batches and get their own results."""
+    batches: list[list] = []
+
+    async def search_batch(queries):
+        batches.append(queries)
+        return [[{"code": query[0]}] for query in queries]
+
+    batcher = MicroBatcher(search_batch, max_batch_size=2, max_wait_ms=1)
+
+    results = await asyncio.gather(
+        *(batcher.search((code, "", "")) for code in ["01", "02", "03"])
+    )
+
+    assert results == [[{"code": "01"}], [{"code": "02"}], [{"code": "03"}]]
+    assert [len(batch) for batch in batches] == [2, 1]
+    stats = batcher.stats()
+    assert stats["batches"] == 2  # noqa: PLR2004
+    assert stats["queries"] == 3  # noqa: PLR2004
+    assert stats["max_batch_size"] == 2  # noqa: PLR2004
+    assert stats["max_queue_wait_ms"] >= 0
+
+
+@pytest.mark.utils
+@pytest.mark.asyncio
+async def test_micro_batcher_propagates_errors_to_every_caller():
+    """A failed batch search should fail every query in the batch."""
+
+    async def search_batch(_queries):
+        raise RuntimeError("Vector store is not ready")
+
+    batcher = MicroBatcher(search_batch, max_batch_size=10, max_wait_ms=1)
+
+    results = await asyncio.gather(
+        batcher.search(("a", "", "")),
+        batcher.search(("b", "", "")),
+        return_exceptions=True,
+    )
+
+    assert all(isinstance(result, RuntimeError) for result in results)
+    assert batcher.stats()["batches"] == 1
+
+
+@pytest.mark.utils
+@pytest.mark.asyncio
+async def test_search_async_uses_micro_batcher_when_enabled(mocker, monkeypatch):
+    """With micro-batching enabled single searches should go through the batcher."""
+    monkeypatch.setattr(vs_module, "MICRO_BATCH_ENABLED", True)
+    manager = _make_ready_manager(mocker)
+    assert manager.batcher is not None
+
+    result = await manager.search_async("cat", "", "")
+
+    assert result == manager.search("cat", "", "")
+    assert manager.batcher.stats()["queries"] == 1
+
+
+@pytest.mark.utils
+def test_search_batch_answers_repeat_queries_from_cache(mocker):
+    """Normalised repeats of a query should not be encoded again."""
+    manager = _make_ready_manager(mocker)
+    first = manager.search("cat", "", "")
+
+    results = manager.search_batch([(" CAT! ", "", ""), ("dog", "", "")])
+
+    assert results[0] is first
+    assert manager.encoder.calls == [["cat", ""], ["dog"]]
+    assert manager.cache.stats()["hits"] == 1
+
+
+@pytest.mark.utils
+@pytest.mark.asyncio
+async def test_search_async_returns_cached_result_without_executor(mocker):
+    """Cached results should be returned without using the search executor."""
+    manager = _make_ready_manager(mocker)
+    first = manager.search("cat", "", "")
+    run = mocker.spy(manager.executor, "run")
+
+    assert await manager.search_async("Cat", "", "") is first
+    run.assert_not_called()
+
+
+@pytest.mark.utils
+def test_vector_store_manager_load_clears_result_cache(mocker, monkeypatch, tmp_path):
+    """Reloading the vector store should invalidate cached results."""
+    monkeypatch.setattr(vs_module, "VECTOR_STORE_DIR", str(tmp_path))
+    mocker.patch("sic_classification_vector_store.utils.vector_store.EmbeddingHandler")
+    manager = VectorStoreManager()
+    manager.cache.put(("cat", "", ""), [])
+
+    manager.load()
+
+    assert len(manager.cache) == 0
+
+
+@pytest.mark.utils
+def test_search_batch_only_encodes_unseen_fields(mocker):
+    """Fields seen in earlier queries should not be encoded again."""
+    manager = _make_ready_manager(mocker)
+    manager.search("cat", "", "")
+
+    manager.search("cat", "dog", "")
+
+    assert manager.encoder.calls == [["cat", ""], ["dog"]]
+
+
+def _save_index(db_dir, codes: list[str]) -> str:
+    """Write a search index artefact of unit vectors and return its checksum."""
+    return SearchIndex(
+        np.eye(len(codes), dtype=np.float32),
+        codes,
+        codes,
+        embedding_model_name="all-MiniLM-L6-v2",
+        k_matches=1,
+    ).save(str(db_dir))
+
+
+@pytest.mark.utils
+def test_reload_swaps_index_and_keeps_encoder(mocker, monkeypatch, tmp_path):
+    """A reload should swap in the new index and report its version."""
+    monkeypatch.setattr(vs_module, "VECTOR_STORE_DIR", str(tmp_path))
+    mock_encoder = mocker.patch(
+        "sic_classification_vector_store.utils.vector_store.SentenceEncoder"
+    )
+    mock_encoder.return_value.model_name = "all-MiniLM-L6-v2"
+    first = _save_index(tmp_path, ["01110", "02100"])
+    manager = VectorStoreManager()
+    manager.load()
+    old_index = manager.index
+    manager.cache.put(("cat", "", ""), [])
+
+    second = _save_index(tmp_path, ["01110", "02100", "03110"])
+    assert manager.reload()
+
+    assert manager.version == second != first
+    assert manager.index is not old_index
+    assert len(manager.index) == 3  # noqa: PLR2004
+    assert len(old_index) == 2  # noqa: PLR2004
+    assert len(manager.cache) == 0
+    mock_encoder.assert_called_once()
+    assert not manager.reloading
+
+
+@pytest.mark.utils
+def test_failed_reload_keeps_serving_current_index(mocker, monkeypatch, tmp_path):
+    """A reload that fails should leave the current index in place."""
+    monkeypatch.setattr(vs_module, "VECTOR_STORE_DIR", str(tmp_path))
+    mocker.patch("sic_classification_vector_store.utils.vector_store.SentenceEncoder")
+    version = _save_index(tmp_path, ["01110", "02100"])
+    manager = VectorStoreManager()
+    manager.load()
+    index = manager.index
+    (tmp_path / "search_index.bin").write_bytes(b"not a search index artefact")
+
+    assert manager.reload()
+
+    assert manager.index is index
+    assert manager.version == version
+    assert "Not a search index" in manager.reload_error
+    assert manager.load_error is None
+
+
+@pytest.mark.utils
+def test_results_from_before_a_reload_are_not_cached(mocker):
+    """Results computed on the old index should not outlive the swap."""
+    manager = _make_ready_manager(mocker)
+    search = manager._search_uncached
+
+    def _search_then_swap(queries):
+        results = search(queries)
+        manager.cache.clear()
+        return results
+
+    mocker.patch.object(manager, "_search_uncached", _search_then_swap)
+    manager.search("cat", "", "")
+
+    assert len(manager.cache) == 0
+
+
+@pytest.mark.utils
+def test_watch_reloads_when_the_artefact_changes(mocker, monkeypatch, tmp_path):
+    """The watcher should reload once the artefact is replaced."""
+    monkeypatch.setattr(vs_module, "VECTOR_STORE_DIR", str(tmp_path))
+    _save_index(tmp_path, ["01110"])
+    manager = VectorStoreManager()
+    stop = Event()
+
+    def _reload():
+        stop.set()
+        return True
+
+    reload = mocker.patch.object(manager, "reload", side_effect=_reload)
+    watcher = Thread(target=manager.watch, args=(0.01, stop))
+    watcher.start()
+    _save_index(tmp_path, ["01110", "02100"])
+    watcher.join(timeout=5)
+
+    assert reload.call_count == 1
+    assert not watcher.is_alive()